@@ -1,18 +1,34 @@
 import asyncio
+import concurrent.futures
 import aiohttp
 import aiofiles
 import os
+import shutil
 import vdf
 import json
 import zipfile
 import threading
+import time
+from collections import defaultdict, deque
 from functools import partial
 from tkinter import END, Text, Scrollbar, messagebox, filedialog
 import customtkinter as ctk
 import sys
-from typing import Any, Dict, List, Optional, Tuple
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 from io import BytesIO
 import subprocess
+import random
 import re
 from datetime import datetime, timezone
 
@@ -26,6 +42,24 @@ except ImportError:
     ImageTk = None
     Image = None
 
+# --- orjson Check ---
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+# --- uvloop Check ---
+try:
+    import uvloop
+
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+    uvloop = None
+
 # --- Platform-specific asyncio policy ---
 if sys.platform == "win32":
     asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
@@ -45,6 +79,184 @@ def tr(text: str) -> str:
     return text
 
 
+def load_json(data: Union[bytes, str]) -> Any:
+    """Parses JSON text or raw bytes, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dump_json_bytes(data: Any) -> bytes:
+    """Serializes data to compact UTF-8 JSON, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+# Matches a depot block holding a DecryptionKey without building the full VDF tree.
+DEPOT_KEY_PATTERN = re.compile(
+    rb'"(\d+)"\s*\{[^{}]*?"DecryptionKey"\s*"([0-9a-fA-F]+)"'
+)
+
+# Lower-cased names of the VDF files that carry depot decryption keys.
+KEY_FILE_NAMES = frozenset(("key.vdf", "config.vdf"))
+
+# Characters dropped from game names in output paths (\w is isalnum() plus "_").
+GAME_NAME_STRIP_PATTERN = re.compile(r"[^\w \-]")
+
+
+def load_git_tree(data: bytes) -> Any:
+    """Decodes a Git trees API response, keeping only the path and type of blobs."""
+    tree_json = load_json(data)
+    if isinstance(tree_json, dict):
+        tree_json["tree"] = [
+            {"path": item.get("path", ""), "type": "blob"}
+            for item in tree_json.get("tree", ())
+            if item.get("type") == "blob"
+        ]
+    return tree_json
+
+
+def iter_files(directory: str) -> Iterator[os.DirEntry]:
+    """Recursively yields the file entries below directory using os.scandir."""
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from iter_files(entry.path)
+            elif entry.is_file(follow_symlinks=False):
+                yield entry
+
+
+def list_relative_files(directory: str) -> Set[str]:
+    """Returns the "/"-separated paths of all files below directory, as in Git trees."""
+    return {
+        os.path.relpath(entry.path, directory).replace(os.sep, "/")
+        for entry in iter_files(directory)
+    }
+
+
+def remove_file_quietly(path: str) -> None:
+    """Deletes path, ignoring files that are already gone or locked."""
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def remove_cache_dirs(directories: List[str]) -> None:
+    """Deletes cached commit folders, and each repo folder once it is empty."""
+    for directory in directories:
+        shutil.rmtree(directory, ignore_errors=True)
+        try:
+            os.rmdir(os.path.dirname(directory))
+        except OSError:
+            pass
+
+
+def prune_cache_dirs(cache_dir: str, max_age: float, max_bytes: int) -> None:
+    """Deletes <repo>/<sha> folders older than max_age, then the least recently used past max_bytes."""
+    cutoff = time.time() - max_age
+    stale_dirs: List[str] = []
+    kept_dirs: List[Tuple[float, str]] = []
+    try:
+        repo_entries = list(os.scandir(cache_dir))
+    except OSError:
+        return
+    for repo_entry in repo_entries:
+        if not repo_entry.is_dir(follow_symlinks=False):
+            continue
+        try:
+            with os.scandir(repo_entry.path) as sha_entries:
+                for sha_entry in sha_entries:
+                    if not sha_entry.is_dir(follow_symlinks=False):
+                        continue
+                    mtime = sha_entry.stat(follow_symlinks=False).st_mtime
+                    if mtime < cutoff:
+                        stale_dirs.append(sha_entry.path)
+                    else:
+                        kept_dirs.append((mtime, sha_entry.path))
+        except OSError:
+            continue
+    total_bytes = 0
+    for _, directory in sorted(kept_dirs, reverse=True):
+        try:
+            total_bytes += sum(
+                entry.stat(follow_symlinks=False).st_size
+                for entry in iter_files(directory)
+            )
+        except OSError:
+            continue
+        if total_bytes > max_bytes:
+            stale_dirs.append(directory)
+    remove_cache_dirs(stale_dirs)
+
+
+def write_file_atomic(path: str, data: bytes) -> None:
+    """Writes data via a temporary file so readers never see a partial file."""
+    parent_dir = os.path.dirname(path)
+    if parent_dir:
+        os.makedirs(parent_dir, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def write_json_file(path: str, data: Any) -> None:
+    """Writes data as JSON, atomically."""
+    write_file_atomic(path, dump_json_bytes(data))
+
+
+def read_file_bytes(path: str) -> bytes:
+    """Reads a whole (small) file in one call, for use from an executor."""
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def index_steam_apps(
+    apps: List[Dict[str, Any]],
+) -> Tuple[List[Tuple[str, str]], List[str], Dict[str, str]]:
+    """Returns (AppID, name) pairs, lower-cased names and an AppID -> name map."""
+    app_pairs: List[Tuple[str, str]] = []
+    names_lower: List[str] = []
+    names_by_appid: Dict[str, str] = {}
+    for app in apps:
+        appid, name = str(app.get("appid")), app.get("name") or ""
+        app_pairs.append((appid, name))
+        names_lower.append(name.lower())
+        names_by_appid.setdefault(appid, name)
+    return app_pairs, names_lower, names_by_appid
+
+
+def write_text_file(path: str, text: str) -> None:
+    """Writes text as UTF-8 in one call, for use from an executor."""
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+
+
+def link_or_copy(src: str, dst: str) -> None:
+    """Hard-links src to dst, falling back to a copy across filesystems."""
+    remove_file_quietly(dst)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+
+def retry_locked_removal(func: Callable[[str], Any], path: str, exc_info) -> None:
+    """shutil.rmtree onerror hook that retries removals blocked by file locks."""
+    if not isinstance(exc_info[1], PermissionError):
+        raise exc_info[1]
+    for _ in range(3):
+        time.sleep(0.05)
+        try:
+            func(path)
+            return
+        except PermissionError:
+            continue
+    raise exc_info[1]
+
+
 # --- Helper for Tooltips ---
 class Tooltip:
     def __init__(self, widget: ctk.CTkBaseClass, text: str):
@@ -98,6 +310,126 @@ class Tooltip:
         self.tip_window = None
 
 
+# --- Virtualized Checkbox List ---
+class VirtualCheckList(ctk.CTkFrame):
+    """Scrollable checkbox list that only creates widgets for the visible rows."""
+
+    ROW_HEIGHT = 28
+
+    def __init__(
+        self,
+        master: Any,
+        states: Dict[str, bool],
+        on_toggle: Callable[[str, bool], None],
+        **kwargs: Any,
+    ):
+        super().__init__(master, **kwargs)
+        self.states = states
+        self.on_toggle = on_toggle
+        self.items: List[str] = []
+        self.offset = 0
+        self.row_widgets: List[ctk.CTkCheckBox] = []
+        self.shown_rows = 0
+
+        self.pack_propagate(False)
+        self.scrollbar = ctk.CTkScrollbar(self, command=self._on_scrollbar)
+        self.scrollbar.pack(side="right", fill="y")
+        self.rows_frame = ctk.CTkFrame(self, fg_color="transparent")
+        self.rows_frame.pack(side="left", fill="both", expand=True)
+        for widget in (self, self.rows_frame):
+            self._bind_mousewheel(widget)
+        self.rows_frame.bind("<Configure>", self._on_configure)
+
+    def set_items(self, items: List[str]) -> None:
+        self.items = list(items)
+        self.offset = max(0, min(self.offset, len(self.items) - self.visible_rows))
+        self.refresh_visible()
+
+    @property
+    def visible_rows(self) -> int:
+        row_height = self._apply_widget_scaling(self.ROW_HEIGHT)
+        return max(1, int(self.rows_frame.winfo_height() // row_height))
+
+    def refresh_visible(self) -> None:
+        rows_needed = max(0, min(self.visible_rows, len(self.items) - self.offset))
+        while len(self.row_widgets) < rows_needed:
+            row_index = len(self.row_widgets)
+            checkbox = ctk.CTkCheckBox(
+                self.rows_frame,
+                text="",
+                command=partial(self._on_row_clicked, row_index),
+            )
+            self._bind_mousewheel(checkbox)
+            self.row_widgets.append(checkbox)
+        if rows_needed != self.shown_rows:
+            for checkbox in self.row_widgets:
+                checkbox.pack_forget()
+            for checkbox in self.row_widgets[:rows_needed]:
+                checkbox.pack(anchor="w", padx=10, pady=2)
+            self.shown_rows = rows_needed
+        # Rows carry no Tcl variable; select()/deselect() just redraw the box,
+        # so rows already showing the right name and state are left alone.
+        for row_index in range(rows_needed):
+            repo_name = self.items[self.offset + row_index]
+            checkbox = self.row_widgets[row_index]
+            if checkbox.cget("text") != repo_name:
+                checkbox.configure(text=repo_name)
+            is_selected = self.states.get(repo_name, False)
+            if is_selected == bool(checkbox.get()):
+                continue
+            if is_selected:
+                checkbox.select()
+            else:
+                checkbox.deselect()
+        if self.items:
+            self.scrollbar.set(
+                self.offset / len(self.items),
+                min(1.0, (self.offset + self.visible_rows) / len(self.items)),
+            )
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    def scroll_to(self, offset: int) -> None:
+        offset = max(0, min(offset, len(self.items) - self.visible_rows))
+        if offset != self.offset:
+            self.offset = offset
+            self.refresh_visible()
+
+    def _on_row_clicked(self, row_index: int) -> None:
+        repo_name = self.items[self.offset + row_index]
+        self.on_toggle(repo_name, bool(self.row_widgets[row_index].get()))
+
+    def _on_scrollbar(self, action: str, value: Any, unit: str = "units") -> None:
+        if action == "moveto":
+            self.scroll_to(round(float(value) * len(self.items)))
+        elif unit == "pages":
+            self.scroll_to(self.offset + int(value) * self.visible_rows)
+        else:
+            self.scroll_to(self.offset + int(value))
+
+    def _on_mousewheel(self, event) -> None:
+        # X11 sends wheel turns as buttons 4/5; Tk 8.7+ there sends <MouseWheel>
+        # events too, whose num is "??" and whose delta only has a useful sign.
+        if event.num in (4, 5):
+            delta = -1 if event.num == 4 else 1
+        elif sys.platform.startswith("win"):
+            delta = -int(event.delta / 40)
+        elif sys.platform == "darwin":
+            delta = -event.delta
+        else:
+            delta = -1 if event.delta > 0 else 1
+        self.scroll_to(self.offset + delta)
+
+    def _bind_mousewheel(self, widget: Any) -> None:
+        widget.bind("<MouseWheel>", self._on_mousewheel)
+        widget.bind("<Button-4>", self._on_mousewheel)
+        widget.bind("<Button-5>", self._on_mousewheel)
+
+    def _on_configure(self, event=None) -> None:
+        self.offset = max(0, min(self.offset, len(self.items) - self.visible_rows))
+        self.refresh_visible()
+
+
 # --- Settings Manager ---
 class SettingsManager:
     """Manages application settings, including loading from and saving to a config file."""
@@ -122,8 +454,8 @@ class SettingsManager:
         }
         if os.path.exists(self.config_file):
             try:
-                with open(self.config_file, "r", encoding="utf-8") as f:
-                    loaded_settings = json.load(f)
+                with open(self.config_file, "rb") as f:
+                    loaded_settings = load_json(f.read())
                     self._settings.update(loaded_settings)
             except (json.JSONDecodeError, IOError):
                 pass
@@ -138,9 +470,8 @@ class SettingsManager:
 
     def save_settings(self) -> None:
         try:
-            with open(self.config_file, "w", encoding="utf-8") as f:
-                json.dump(self._settings, f, indent=4)
-        except IOError:
+            write_json_file(self.config_file, self._settings)
+        except OSError:
             pass
 
     def get(self, key: str, default: Any = None) -> Any:
@@ -179,8 +510,8 @@ class LocalizationManager:
                 lang_code = filename[:-5]
                 filepath = os.path.join(self.lang_dir, filename)
                 try:
-                    with open(filepath, "r", encoding="utf-8") as f:
-                        self.translations[lang_code] = json.load(f)
+                    with open(filepath, "rb") as f:
+                        self.translations[lang_code] = load_json(f.read())
                         any_translation_loaded = True
                 except (json.JSONDecodeError, IOError) as e:
                     self.app.after(
@@ -281,9 +612,67 @@ class ManifestDownloader(ctk.CTk):
     """
 
     APP_VERSION = "2.0.2"
+    MAX_CONCURRENT_DOWNLOADS = 8
+    MAX_CONCURRENT_IMAGE_DOWNLOADS = 6
+    WRITE_BUFFER_SIZE = 1 << 20
+    DOWNLOAD_CHUNK_SIZE = 1 << 16
+    CONTENT_CACHE_DIR = "cache"
+    CONTENT_CACHE_MAX_AGE = 30 * 24 * 60 * 60
+    CONTENT_CACHE_MAX_BYTES = 2 * 1024 * 1024 * 1024
+    MIRROR_HEDGE_DELAY = 1.5
+    MAX_RETRY_DELAY = 30.0
+    PROGRESS_DRAIN_INTERVAL_MS = 33
+    GITHUB_CACHE_TTL = 60
+    # Pseudo-status from _get_github_json while GitHub's rate limit is exhausted.
+    GITHUB_RATE_LIMITED = -1
+    GITHUB_CACHE_FILE = "github_api.json"
+    MAX_PERSISTED_GITHUB_RESPONSES = 200
+    STEAM_APP_LIST_CACHE_FILE = "steam_app_list.json"
+    STEAM_APP_LIST_MAX_AGE = 24 * 60 * 60
+    EXECUTOR_JSON_MIN_BYTES = 256 * 1024
+    MISSING_CONTENT_TTL = 60
+    MIRROR_TIMEOUT_BENCH = 30.0
+    MIRROR_STATS_ALPHA = 0.2
+    MIN_MIRROR_SUCCESS_RATE = 0.2
+    DEFLATED_ZIP_EXTENSIONS = (".lua", ".vdf", ".json", ".txt")
+    MAX_PROGRESS_LINES = 500
     GITHUB_RELEASES_API = (
         "https://api.github.com/repos/fairy-root/steam-depot-online/releases/latest"
     )
+    ABOUT_TEXT_TAGS: Dict[str, Dict[str, Any]] = {
+        "bold": {"font": ("Helvetica", 11, "bold")},
+        "italic": {"font": ("Helvetica", 11, "italic")},
+        "title": {
+            "font": ("Helvetica", 14, "bold"),
+            "foreground": "cyan",
+            "spacing1": 10,
+            "spacing3": 15,
+            "justify": "center",
+        },
+        "subtitle": {
+            "font": ("Helvetica", 12, "bold"),
+            "foreground": "deepskyblue",
+            "spacing1": 8,
+            "spacing3": 8,
+        },
+        "highlight": {"foreground": "lawn green"},
+        "note": {"foreground": "orange"},
+        "normal": {"font": ("Helvetica", 11), "spacing3": 5},
+        "url": {
+            "font": ("Helvetica", 11),
+            "foreground": "light sky blue",
+            "underline": True,
+        },
+        "code": {
+            "font": ("Courier New", 10),
+            "background": "#404040",
+            "foreground": "#E0E0E0",
+            "lmargin1": 15,
+            "lmargin2": 15,
+            "spacing1": 3,
+            "spacing3": 3,
+        },
+    }
 
     def __init__(self) -> None:
         super().__init__()
@@ -321,30 +710,94 @@ class ManifestDownloader(ctk.CTk):
             repo: saved_selected_repos.get(repo, (repo_type == "Branch"))
             for repo, repo_type in self.repos.items()
         }
-        self.repo_vars: Dict[str, ctk.BooleanVar] = {}
+        self._repos_dirty: bool = False
+        self._selected_repos_dirty: bool = False
+        self._repos_flush_job: Optional[str] = None
+        # Filled from disk on the loop thread at startup; empty until then.
+        self._github_json_cache: Dict[str, Tuple[Optional[str], Any, float]] = {}
+        # Wall-clock time (like X-RateLimit-Reset) before which GitHub will refuse calls.
+        self._github_rate_limited_until: float = 0.0
+        self._mirror_rate_limit_hits: Dict[str, int] = defaultdict(int)
+        self._mirror_benched_until: Dict[str, float] = {}
+        # host -> (success rate EMA, latency EMA in seconds, sample count)
+        self._mirror_stats: Dict[str, Tuple[float, float, int]] = {}
+        self._missing_content_until: Dict[str, float] = {}
+        self._created_dirs: Set[str] = set()
+        # <repo>/<sha> cache folders whose last-used time this batch already refreshed.
+        self._content_cache_dirs_used: Set[str] = set()
 
         self.appid_to_game: Dict[str, str] = {}
         self.selected_appid: Optional[str] = None
         self.selected_game_name: Optional[str] = None
-        self.search_thread: Optional[threading.Thread] = None
+        self.search_future: Optional[concurrent.futures.Future] = None
+        self.details_future: Optional[concurrent.futures.Future] = None
         self.cancel_search: bool = False
-
-        self.steam_app_list: List[Dict[str, Any]] = []
+        # Snapshot of the strict validation checkbox for the running batch; Tk
+        # variables must not be read from the loop or executor threads.
+        self._strict_mode_active: bool = False
+
+        # (AppID, name) pairs; the decoded dicts are dropped once indexed.
+        self.steam_app_list: List[Tuple[str, str]] = []
+        # Parallel to steam_app_list, so searches skip lower-casing every name.
+        self._steam_app_names_lower: List[str] = []
+        self._steam_app_names_by_appid: Dict[str, str] = {}
         self.app_list_loaded_event = threading.Event()
-        self.initial_load_thread: Optional[threading.Thread] = None
+
+        # uvloop (POSIX only) cuts per-callback overhead for the many small
+        # coroutine steps of a download; the stock loop is the fallback.
+        self._loop = (
+            uvloop.new_event_loop() if UVLOOP_AVAILABLE else asyncio.new_event_loop()
+        )
+        self._connector: Optional[aiohttp.TCPConnector] = None
+        # Created on the loop thread at first use, shared by every image fetch.
+        self._image_semaphore: Optional[asyncio.Semaphore] = None
+        self._loop_thread = threading.Thread(target=self._run_event_loop, daemon=True)
+        self._loop_thread.start()
 
         self.image_references: List[ctk.CTkImage] = []
         self._dynamic_content_start_index: str = "1.0"
         self.progress_text: Optional[Text] = None
+        self._progress_queue: Deque[
+            Union[Tuple[str, str, Optional[Tuple[str, ...]]], Callable[[], None]]
+        ] = deque()
         self.rate_limit_display_label: Optional[ctk.CTkLabel] = None
 
         self.setup_ui()
         self._refresh_ui_texts()
+        self._run_coroutine(self._async_load_github_json_cache())
         self._start_initial_app_list_load()
+        self.after(self.PROGRESS_DRAIN_INTERVAL_MS, self._drain_progress_queue)
         self._bind_shortcuts()
 
         if self.settings_manager.get("app_update_check_on_startup"):
-            threading.Thread(target=self.run_update_check, daemon=True).start()
+            self._run_coroutine(self.async_check_for_updates())
+
+    def _run_event_loop(self) -> None:
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+
+    def _run_coroutine(
+        self, coro, on_done: Optional[Callable[[], None]] = None
+    ) -> concurrent.futures.Future:
+        future = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        future.add_done_callback(partial(self._on_coroutine_done, on_done=on_done))
+        return future
+
+    def _on_coroutine_done(
+        self,
+        future: concurrent.futures.Future,
+        on_done: Optional[Callable[[], None]] = None,
+    ) -> None:
+        # Nothing else waits on these futures, so an exception would vanish.
+        if not future.cancelled() and future.exception() is not None:
+            self.print_colored_ui(
+                tr("Unexpected error in background task: {error}").format(
+                    error=self.stack_Error(future.exception())
+                ),
+                "red",
+            )
+        if on_done is not None:
+            self.after(0, on_done)
 
     def _get_github_headers(self) -> Optional[Dict[str, str]]:
         if self.settings_manager.get("use_github_api_token"):
@@ -356,35 +809,188 @@ class ManifestDownloader(ctk.CTk):
                 }
         return None
 
-    def _start_initial_app_list_load(self) -> None:
-        self.initial_load_thread = threading.Thread(
-            target=self._run_initial_app_list_load, daemon=True
+    def _create_http_session(self) -> aiohttp.ClientSession:
+        # Sessions share one connector so pooled connections and cached DNS
+        # lookups outlive any single search or download.
+        if self._connector is None or self._connector.closed:
+            self._connector = aiohttp.TCPConnector(
+                limit=64, limit_per_host=8, ttl_dns_cache=600, keepalive_timeout=60
+            )
+        # None of the endpoints set cookies we need; skip parsing and storing them.
+        return aiohttp.ClientSession(
+            connector=self._connector,
+            connector_owner=False,
+            cookie_jar=aiohttp.DummyCookieJar(),
         )
-        self.initial_load_thread.start()
 
-    def _run_initial_app_list_load(self) -> None:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
+    async def _shutdown_event_loop(self) -> None:
+        if self._connector is not None:
+            await self._connector.close()
+        asyncio.get_running_loop().stop()
+
+    async def _get_github_json(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        headers: Dict[str, str],
+        timeout: float,
+    ) -> Tuple[int, Any]:
+        cached = self._github_json_cache.get(url)
+        if cached and cached[2] > time.monotonic():
+            return 200, cached[1]
+        request_headers = dict(headers)
+        if cached and cached[0]:
+            # Conditional requests answered with 304 do not count against the rate limit.
+            request_headers["If-None-Match"] = cached[0]
+        limit_wait = self._github_rate_limited_until - time.time()
+        if limit_wait > 0:
+            if limit_wait <= self.MAX_RETRY_DELAY:
+                await asyncio.sleep(limit_wait)
+            elif not request_headers.get("If-None-Match"):
+                # Only a conditional request could still be answered (with a 304).
+                return self.GITHUB_RATE_LIMITED, None
+        async with session.get(
+            url,
+            headers=request_headers,
+            ssl=False,
+            timeout=aiohttp.ClientTimeout(total=timeout),
+        ) as response:
+            self._note_github_rate_limit(response)
+            # Re-inserting keeps the dict ordered from least to most recently used.
+            self._github_json_cache.pop(url, None)
+            if response.status == 304 and cached:
+                self._github_json_cache[url] = (
+                    cached[0],
+                    cached[1],
+                    time.monotonic() + self.GITHUB_CACHE_TTL,
+                )
+                return 200, cached[1]
+            if response.status != 200:
+                if (
+                    response.status in (403, 429)
+                    and self._github_rate_limited_until > time.time()
+                ):
+                    return self.GITHUB_RATE_LIMITED, None
+                return response.status, None
+            payload = await response.read()
+            # Only blob paths are ever read from trees, and they are cached for
+            # the whole session, so the other per-entry fields are dropped early.
+            decode = load_git_tree if "/git/trees/" in url else load_json
+            if len(payload) >= self.EXECUTOR_JSON_MIN_BYTES:
+                # Recursive trees can run to megabytes; decode those off the loop.
+                data = await asyncio.get_running_loop().run_in_executor(
+                    None, decode, payload
+                )
+            else:
+                data = decode(payload)
+            self._github_json_cache[url] = (
+                response.headers.get("ETag"),
+                data,
+                time.monotonic() + self.GITHUB_CACHE_TTL,
+            )
+            return 200, data
+
+    def _note_github_rate_limit(self, response: aiohttp.ClientResponse) -> None:
+        limited_until = 0.0
         try:
-            loop.run_until_complete(self._async_load_steam_app_list())
-        finally:
-            loop.close()
+            if response.headers.get("X-RateLimit-Remaining") == "0":
+                limited_until = float(response.headers.get("X-RateLimit-Reset", 0))
+            elif response.status in (403, 429) and "Retry-After" in response.headers:
+                limited_until = time.time() + float(response.headers["Retry-After"])
+        except ValueError:
+            return
+        self._github_rate_limited_until = max(
+            self._github_rate_limited_until, limited_until
+        )
+
+    def _report_github_rate_limit(self, repo_full_name: str, has_token: bool) -> None:
+        reset_time = time.strftime(
+            "%H:%M:%S", time.localtime(self._github_rate_limited_until)
+        )
+        message = tr(
+            "GitHub API rate limit reached until {reset_time}. Skipping {repo_full_name}."
+        ).format(reset_time=reset_time, repo_full_name=repo_full_name)
+        if not has_token:
+            message += " " + tr("A GitHub token in Settings raises the limit.")
+        self.print_colored_ui(message, "red")
+
+    async def _async_load_github_json_cache(self) -> None:
+        # Saved recursive trees can add up to megabytes of JSON; decode off the UI.
+        loaded = await asyncio.get_running_loop().run_in_executor(
+            None, self._read_github_json_cache
+        )
+        # Answers fetched while loading are newer, so they win and stay last in order.
+        self._github_json_cache = {**loaded, **self._github_json_cache}
+
+    def _read_github_json_cache(self) -> Dict[str, Tuple[Optional[str], Any, float]]:
+        path = os.path.join(self.CONTENT_CACHE_DIR, self.GITHUB_CACHE_FILE)
+        try:
+            stored = load_json(read_file_bytes(path))
+            # Saved answers are revalidated with If-None-Match before use, except
+            # trees, which are addressed by SHA and never change.
+            return {
+                url: (etag, data, float("inf") if "/git/trees/" in url else 0.0)
+                for url, (etag, data) in stored.items()
+            }
+        except (OSError, ValueError, TypeError, AttributeError):
+            return {}
+
+    async def _save_github_json_cache(self) -> None:
+        recent = list(self._github_json_cache.items())[
+            -self.MAX_PERSISTED_GITHUB_RESPONSES :
+        ]
+        snapshot = {url: [etag, data] for url, (etag, data, _) in recent if etag}
+        path = os.path.join(self.CONTENT_CACHE_DIR, self.GITHUB_CACHE_FILE)
+        try:
+            await asyncio.get_running_loop().run_in_executor(
+                None, write_json_file, path, snapshot
+            )
+        except OSError:
+            pass
+
+    def _start_initial_app_list_load(self) -> None:
+        self._run_coroutine(self._async_load_steam_app_list())
 
     async def _async_load_steam_app_list(self) -> None:
+        loop = asyncio.get_running_loop()
+        cache_path = os.path.join(
+            self.CONTENT_CACHE_DIR, self.STEAM_APP_LIST_CACHE_FILE
+        )
+        cache_age: Optional[float] = None
         try:
-            async with aiohttp.ClientSession() as session:
+            cache_age = time.time() - os.path.getmtime(cache_path)
+            payload = await loop.run_in_executor(None, read_file_bytes, cache_path)
+            await self._apply_steam_app_list(payload)
+        except (OSError, ValueError, AttributeError):
+            cache_age = None
+        # A cached list serves searches right away; once it is a day old it is
+        # refreshed in the background, reporting nothing unless it succeeds.
+        announce = cache_age is None
+        if not announce:
+            self.append_progress(tr("Steam app list loaded successfully."), "green")
+            self._enable_search_after_app_list()
+            if cache_age < self.STEAM_APP_LIST_MAX_AGE:
+                return
+        try:
+            async with self._create_http_session() as session:
                 async with session.get(
                     "https://raw.githubusercontent.com/dgibbs64/SteamCMD-AppID-List/main/steamcmd_appid.json",
                     timeout=aiohttp.ClientTimeout(total=30),
                 ) as response:
                     if response.status == 200:
-                        data = await response.json(content_type=None)
-                        self.steam_app_list = data.get("applist", {}).get("apps", [])
-                        self.app_list_loaded_event.set()
-                        self.append_progress(
-                            tr("Steam app list loaded successfully."), "green"
-                        )
-                    else:
+                        payload = await response.read()
+                        await self._apply_steam_app_list(payload)
+                        if announce:
+                            self.append_progress(
+                                tr("Steam app list loaded successfully."), "green"
+                            )
+                        try:
+                            await loop.run_in_executor(
+                                None, write_file_atomic, cache_path, payload
+                            )
+                        except OSError:
+                            pass
+                    elif announce:
                         self.append_progress(
                             tr(
                                 "Initialization: Failed to load Steam app list (Status: {response_status}). Search by name may not work. You can still search by AppID."
@@ -392,27 +998,47 @@ class ManifestDownloader(ctk.CTk):
                             "red",
                         )
         except (aiohttp.ClientError, asyncio.TimeoutError) as e:
-            self.append_progress(
-                tr(
-                    "Initialization: Error fetching Steam app list: {error}. Search by name may not work."
-                ).format(error=self.stack_Error(e)),
-                "red",
-            )
+            if announce:
+                self.append_progress(
+                    tr(
+                        "Initialization: Error fetching Steam app list: {error}. Search by name may not work."
+                    ).format(error=self.stack_Error(e)),
+                    "red",
+                )
         except json.JSONDecodeError:
-            self.append_progress(
-                tr(
-                    "Initialization: Failed to decode Steam app list response. Search by name may not work."
-                ),
-                "red",
-            )
+            if announce:
+                self.append_progress(
+                    tr(
+                        "Initialization: Failed to decode Steam app list response. Search by name may not work."
+                    ),
+                    "red",
+                )
         except Exception as e:
-            self.append_progress(
-                tr(
-                    "Initialization: Unexpected error loading Steam app list: {error}."
-                ).format(error=self.stack_Error(e)),
-                "red",
-            )
+            if announce:
+                self.append_progress(
+                    tr(
+                        "Initialization: Unexpected error loading Steam app list: {error}."
+                    ).format(error=self.stack_Error(e)),
+                    "red",
+                )
+
+        if announce:
+            self._enable_search_after_app_list()
 
+    async def _apply_steam_app_list(self, payload: bytes) -> None:
+        # The full app list is large; decode and index it without stalling
+        # other coroutines on the loop.
+        loop = asyncio.get_running_loop()
+        data = await loop.run_in_executor(None, load_json, payload)
+        app_pairs, names_lower, names_by_appid = await loop.run_in_executor(
+            None, index_steam_apps, data.get("applist", {}).get("apps", [])
+        )
+        self._steam_app_names_lower = names_lower
+        self._steam_app_names_by_appid = names_by_appid
+        self.steam_app_list = app_pairs
+        self.app_list_loaded_event.set()
+
+    def _enable_search_after_app_list(self) -> None:
         self.after(0, lambda: self.search_button.configure(state="normal"))
         self.after(0, self._update_dynamic_content_start_index)
 
@@ -424,8 +1050,8 @@ class ManifestDownloader(ctk.CTk):
         path = filepath if filepath else "repositories.json"
         if os.path.exists(path):
             try:
-                with open(path, "r", encoding="utf-8") as f:
-                    repos = json.load(f)
+                with open(path, "rb") as f:
+                    repos = load_json(f.read())
                     cleaned_repos = {
                         k: v
                         for k, v in repos.items()
@@ -440,20 +1066,38 @@ class ManifestDownloader(ctk.CTk):
                 return {}
         return {}
 
-    def save_repositories(self, filepath: Optional[str] = None) -> None:
-        path = filepath if filepath else "repositories.json"
-        try:
-            with open(path, "w", encoding="utf-8") as f:
-                json.dump(self.repos, f, indent=4)
-        except IOError:
-            messagebox.showerror(
-                tr("Save Error"), tr("Failed to save repositories.json.")
-            )
+    def save_repositories(self) -> None:
+        self._repos_dirty = True
+        self._schedule_repositories_flush()
+
+    def save_selected_repos(self) -> None:
+        # Checkbox changes only touch settings.json; repositories.json is unchanged.
+        self._selected_repos_dirty = True
+        self._schedule_repositories_flush()
+
+    def _schedule_repositories_flush(self) -> None:
+        if self._repos_flush_job is not None:
+            self.after_cancel(self._repos_flush_job)
+        self._repos_flush_job = self.after(500, self._flush_repositories)
+
+    def _flush_repositories(self) -> None:
+        if self._repos_flush_job is not None:
+            self.after_cancel(self._repos_flush_job)
+            self._repos_flush_job = None
+        if not (self._repos_dirty or self._selected_repos_dirty):
+            return
+        repos_dirty = self._repos_dirty
+        self._repos_dirty = self._selected_repos_dirty = False
 
-        saved_selected_repos_state = {
-            name: var.get() for name, var in self.repo_vars.items()
-        }
-        self.settings_manager.set("selected_repos", saved_selected_repos_state)
+        if repos_dirty:
+            try:
+                write_json_file("repositories.json", self.repos)
+            except OSError:
+                messagebox.showerror(
+                    tr("Save Error"), tr("Failed to save repositories.json.")
+                )
+
+        self.settings_manager.set("selected_repos", dict(self.selected_repos))
         self.settings_manager.save_settings()
 
     def setup_ui(self) -> None:
@@ -491,8 +1135,12 @@ class ManifestDownloader(ctk.CTk):
             self.select_all_enc_button,
             tr("Toggle selection for all Encrypted repositories."),
         )
-        self.encrypted_scroll = ctk.CTkScrollableFrame(
-            encrypted_frame, width=240, height=135
+        self.encrypted_scroll = VirtualCheckList(
+            encrypted_frame,
+            self.selected_repos,
+            self._update_selected_repo_state,
+            width=240,
+            height=135,
         )
         self.encrypted_scroll.pack(padx=9, pady=4.5, fill="both", expand=True)
 
@@ -518,8 +1166,12 @@ class ManifestDownloader(ctk.CTk):
             self.select_all_dec_button,
             tr("Toggle selection for all Decrypted repositories."),
         )
-        self.decrypted_scroll = ctk.CTkScrollableFrame(
-            decrypted_frame, width=240, height=135
+        self.decrypted_scroll = VirtualCheckList(
+            decrypted_frame,
+            self.selected_repos,
+            self._update_selected_repo_state,
+            width=240,
+            height=135,
         )
         self.decrypted_scroll.pack(padx=9, pady=4.5, fill="both", expand=True)
 
@@ -545,7 +1197,13 @@ class ManifestDownloader(ctk.CTk):
             self.select_all_branch_button,
             tr("Toggle selection for all Branch repositories."),
         )
-        self.branch_scroll = ctk.CTkScrollableFrame(branch_frame, width=240, height=135)
+        self.branch_scroll = VirtualCheckList(
+            branch_frame,
+            self.selected_repos,
+            self._update_selected_repo_state,
+            width=240,
+            height=135,
+        )
         self.branch_scroll.pack(padx=9, pady=4.5, fill="both", expand=True)
 
         self.refresh_repo_checkboxes()
@@ -993,7 +1651,44 @@ class ManifestDownloader(ctk.CTk):
         color: str = "default",
         tags: Optional[Tuple[str, ...]] = None,
     ) -> None:
-        self.after(0, partial(self._append_progress_direct, message, color, tags))
+        self._progress_queue.append((message, color, tags))
+
+    def _drain_progress_queue(self) -> None:
+        # Log lines from worker threads are batched into one widget update per tick.
+        try:
+            if self._progress_queue and self.progress_text is not None:
+                self.progress_text.configure(state="normal")
+                # Alternating text/tags arguments for a single insert; consecutive
+                # lines with the same tags are merged into one text chunk.
+                segments: List[Any] = []
+                while self._progress_queue:
+                    item = self._progress_queue.popleft()
+                    if callable(item):
+                        if segments:
+                            self.progress_text.insert(END, *segments)
+                            segments = []
+                        item()
+                        self.progress_text.configure(state="normal")
+                        continue
+                    message, color, tags = item
+                    final_tags = (color,)
+                    if tags:
+                        final_tags += tags
+                    if segments and segments[-1] == final_tags:
+                        segments[-2] += message + "\n"
+                    else:
+                        segments += [message + "\n", final_tags]
+                if segments:
+                    self.progress_text.insert(END, *segments)
+                line_count = int(self.progress_text.index("end-1c").split(".")[0])
+                if line_count > self.MAX_PROGRESS_LINES:
+                    self.progress_text.delete(
+                        "1.0", f"{line_count - self.MAX_PROGRESS_LINES + 1}.0"
+                    )
+                self.progress_text.see(END)
+                self.progress_text.configure(state="disabled")
+        finally:
+            self.after(self.PROGRESS_DRAIN_INTERVAL_MS, self._drain_progress_queue)
 
     def _clear_and_reinitialize_progress_area(self) -> None:
         if self.progress_text:
@@ -1056,80 +1751,34 @@ class ManifestDownloader(ctk.CTk):
             self.download_button.configure(state="normal")
             return
 
-        if self.search_thread and self.search_thread.is_alive():
-            self.cancel_search = True
+        if self.search_future and not self.search_future.done():
+            self.search_future.cancel()
             self.append_progress(tr("Cancelling previous search..."), "yellow")
 
         self._clear_and_reinitialize_progress_area()
         self.cancel_search = False
-        self.search_thread = threading.Thread(
-            target=self.run_search, args=(user_input,), daemon=True
-        )
-        self.search_thread.start()
-
-    def run_search(self, user_input: str) -> None:
-        search_loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(search_loop)
-        try:
-            search_loop.run_until_complete(self.async_search_game(user_input))
-        finally:
-            search_loop.close()
+        self.search_future = self._run_coroutine(self.async_search_game(user_input))
 
     async def async_search_game(self, user_input: str) -> None:
         games_found: List[Dict[str, Any]] = []
         max_results = 200
+        prefetched_capsules: Dict[str, Optional[bytes]] = {}
 
         if user_input.isdigit():
             appid_to_search = user_input
-            url = f"https://store.steampowered.com/api/appdetails?appids={appid_to_search}&l=english"
-            try:
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(
-                        url, timeout=aiohttp.ClientTimeout(total=15)
-                    ) as response:
-                        if response.status == 200:
-                            response_data = await response.json()
-                            if response_data and response_data.get(
-                                appid_to_search, {}
-                            ).get("success"):
-                                game_data = response_data[appid_to_search]["data"]
-                                game_name = game_data.get(
-                                    "name", f"AppID {appid_to_search}"
-                                )
-                                games_found.append(
-                                    {"appid": appid_to_search, "name": game_name}
-                                )
-                            else:
-                                self.append_progress(
-                                    tr(
-                                        "No game found or API error for AppID {appid_to_search}."
-                                    ).format(appid_to_search=appid_to_search),
-                                    "red",
-                                )
-                        else:
-                            self.append_progress(
-                                tr(
-                                    "Failed to fetch details for AppID {appid_to_search} (Status: {response_status})."
-                                ).format(
-                                    appid_to_search=appid_to_search,
-                                    response_status=response.status,
-                                ),
-                                "red",
-                            )
-            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
-                self.append_progress(
-                    tr("Error fetching AppID {appid_to_search}: {error}").format(
-                        appid_to_search=appid_to_search, error=self.stack_Error(e)
-                    ),
-                    "red",
-                )
-            except json.JSONDecodeError:
-                self.append_progress(
-                    tr("Failed to decode JSON for AppID {appid_to_search}.").format(
-                        appid_to_search=appid_to_search
+            async with self._create_http_session() as session:
+                # The capsule URL only depends on the AppID, so fetch it alongside
+                # the details lookup instead of after it.
+                game_name, capsule_data = await asyncio.gather(
+                    self._fetch_game_name_by_appid(session, appid_to_search),
+                    self._download_image_async(
+                        session,
+                        f"https://cdn.akamai.steamstatic.com/steam/apps/{appid_to_search}/capsule_231x87.jpg",
                     ),
-                    "red",
                 )
+            if game_name:
+                games_found.append({"appid": appid_to_search, "name": game_name})
+                prefetched_capsules[appid_to_search] = capsule_data
         else:
             if not self.app_list_loaded_event.is_set():
                 self.append_progress(
@@ -1139,22 +1788,25 @@ class ManifestDownloader(ctk.CTk):
                 return
 
             search_term_lower = user_input.lower()
-            for app_info in self.steam_app_list:
+            matching_indices = (
+                index
+                for index, name_lower in enumerate(self._steam_app_names_lower)
+                if search_term_lower in name_lower
+            )
+            for index in matching_indices:
                 if self.cancel_search:
                     self.append_progress(tr("\nName search cancelled."), "yellow")
                     return
-                if search_term_lower in app_info.get("name", "").lower():
-                    games_found.append(
-                        {"appid": str(app_info["appid"]), "name": app_info["name"]}
+                appid, game_name = self.steam_app_list[index]
+                games_found.append({"appid": appid, "name": game_name})
+                if len(games_found) >= max_results:
+                    self.append_progress(
+                        tr(
+                            "Max results ({max_results}) reached. Please refine your search."
+                        ).format(max_results=max_results),
+                        "yellow",
                     )
-                    if len(games_found) >= max_results:
-                        self.append_progress(
-                            tr(
-                                "Max results ({max_results}) reached. Please refine your search."
-                            ).format(max_results=max_results),
-                            "yellow",
-                        )
-                        break
+                    break
 
         if self.cancel_search:
             self.append_progress(tr("\nSearch cancelled by user action."), "yellow")
@@ -1169,22 +1821,31 @@ class ManifestDownloader(ctk.CTk):
         capsule_tasks = []
         game_data_for_ui = []
 
-        for idx, game in enumerate(games_found, 1):
-            if self.cancel_search:
-                self.append_progress(tr("\nSearch display cancelled."), "yellow")
-                return
-            appid, game_name = str(game.get("appid", "Unknown")), game.get(
-                "name", tr("Unknown Game")
-            )
-            self.appid_to_game[appid] = game_name
-            capsule_url = f"https://cdn.akamai.steamstatic.com/steam/apps/{appid}/capsule_231x87.jpg"
-            if PIL_AVAILABLE:
-                capsule_tasks.append(self._download_image_async(capsule_url))
-            else:
-                capsule_tasks.append(asyncio.sleep(0, result=None))
-            game_data_for_ui.append((idx, appid, game_name))
+        async with self._create_http_session() as session:
+            for idx, game in enumerate(games_found, 1):
+                if self.cancel_search:
+                    self.append_progress(tr("\nSearch display cancelled."), "yellow")
+                    return
+                appid, game_name = str(game.get("appid", "Unknown")), game.get(
+                    "name", tr("Unknown Game")
+                )
+                self.appid_to_game[appid] = game_name
+                capsule_url = f"https://cdn.akamai.steamstatic.com/steam/apps/{appid}/capsule_231x87.jpg"
+                if appid in prefetched_capsules:
+                    capsule_tasks.append(
+                        asyncio.sleep(0, result=prefetched_capsules[appid])
+                    )
+                elif PIL_AVAILABLE:
+                    capsule_tasks.append(
+                        self._download_image_async(session, capsule_url)
+                    )
+                else:
+                    capsule_tasks.append(asyncio.sleep(0, result=None))
+                game_data_for_ui.append((idx, appid, game_name))
 
-        capsule_results = await asyncio.gather(*capsule_tasks, return_exceptions=True)
+            capsule_results = await asyncio.gather(
+                *capsule_tasks, return_exceptions=True
+            )
 
         for i, (idx, appid, game_name) in enumerate(game_data_for_ui):
             if self.cancel_search:
@@ -1210,6 +1871,54 @@ class ManifestDownloader(ctk.CTk):
             "cyan",
         )
 
+    async def _fetch_game_name_by_appid(
+        self, session: aiohttp.ClientSession, appid_to_search: str
+    ) -> Optional[str]:
+        url = f"https://store.steampowered.com/api/appdetails?appids={appid_to_search}&l=english"
+        try:
+            async with session.get(
+                url, timeout=aiohttp.ClientTimeout(total=15)
+            ) as response:
+                if response.status == 200:
+                    response_data = load_json(await response.read())
+                    if response_data and response_data.get(appid_to_search, {}).get(
+                        "success"
+                    ):
+                        game_data = response_data[appid_to_search]["data"]
+                        return game_data.get("name", f"AppID {appid_to_search}")
+                    else:
+                        self.append_progress(
+                            tr(
+                                "No game found or API error for AppID {appid_to_search}."
+                            ).format(appid_to_search=appid_to_search),
+                            "red",
+                        )
+                else:
+                    self.append_progress(
+                        tr(
+                            "Failed to fetch details for AppID {appid_to_search} (Status: {response_status})."
+                        ).format(
+                            appid_to_search=appid_to_search,
+                            response_status=response.status,
+                        ),
+                        "red",
+                    )
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            self.append_progress(
+                tr("Error fetching AppID {appid_to_search}: {error}").format(
+                    appid_to_search=appid_to_search, error=self.stack_Error(e)
+                ),
+                "red",
+            )
+        except json.JSONDecodeError:
+            self.append_progress(
+                tr("Failed to decode JSON for AppID {appid_to_search}.").format(
+                    appid_to_search=appid_to_search
+                ),
+                "red",
+            )
+        return None
+
     def create_radio_button(
         self, idx: int, appid: str, game_name: str, capsule_image_data: Optional[bytes]
     ) -> None:
@@ -1283,30 +1992,34 @@ class ManifestDownloader(ctk.CTk):
 
             self.download_button.configure(state="normal")
             self.download_mode_var.set("selected_game")
-            threading.Thread(
-                target=self.run_display_game_details,
-                args=(self.selected_appid, self.selected_game_name),
-                daemon=True,
-            ).start()
+            # A previous pick still loading would otherwise race this one into
+            # the freshly cleared details area.
+            if self.details_future and not self.details_future.done():
+                self.details_future.cancel()
+            self.details_future = self._run_coroutine(
+                self.async_display_game_details(
+                    self.selected_appid, self.selected_game_name
+                )
+            )
         else:
             self.append_progress(
                 tr("Selected game not found in mapping. This is unexpected."), "red"
             )
             self.download_button.configure(state="disabled")
 
-    def run_display_game_details(self, appid: str, game_name: str) -> None:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            loop.run_until_complete(self.async_display_game_details(appid, game_name))
-        finally:
-            loop.close()
-
-    async def _download_image_async(self, url: str) -> Optional[bytes]:
+    async def _download_image_async(
+        self, session: aiohttp.ClientSession, url: str
+    ) -> Optional[bytes]:
         if not PIL_AVAILABLE:
             return None
+        if self._image_semaphore is None:
+            self._image_semaphore = asyncio.Semaphore(
+                self.MAX_CONCURRENT_IMAGE_DOWNLOADS
+            )
         try:
-            async with aiohttp.ClientSession() as session:
+            # Queue here rather than in the connector pool, where the wait would
+            # count against each image's 10 s timeout.
+            async with self._image_semaphore:
                 async with session.get(
                     url, timeout=aiohttp.ClientTimeout(total=10)
                 ) as response:
@@ -1393,12 +2106,14 @@ class ManifestDownloader(ctk.CTk):
         header_data: Optional[bytes] = None
         game_api_data: Optional[Dict[str, Any]] = None
 
-        async with aiohttp.ClientSession() as session:
+        async with self._create_http_session() as session:
             tasks = []
             if PIL_AVAILABLE:
-                tasks.append(asyncio.create_task(self._download_image_async(logo_url)))
                 tasks.append(
-                    asyncio.create_task(self._download_image_async(header_url))
+                    asyncio.create_task(self._download_image_async(session, logo_url))
+                )
+                tasks.append(
+                    asyncio.create_task(self._download_image_async(session, header_url))
                 )
             tasks.append(
                 asyncio.create_task(
@@ -1423,7 +2138,7 @@ class ManifestDownloader(ctk.CTk):
                 appdetails_response = appdetails_response_or_exc
                 if appdetails_response.status == 200:
                     try:
-                        api_json = await appdetails_response.json()
+                        api_json = await appdetails_response.json(loads=load_json)
                         if api_json and api_json.get(appid, {}).get("success"):
                             game_api_data = api_json[appid]["data"]
                         else:
@@ -1443,6 +2158,8 @@ class ManifestDownloader(ctk.CTk):
                             ("game_detail_section",),
                         )
                 else:
+                    # The body is never read here, so hand the connection back.
+                    appdetails_response.release()
                     self.append_progress(
                         tr(
                             "Failed to fetch AppID {appid} details (Status: {status})."
@@ -1468,12 +2185,11 @@ class ManifestDownloader(ctk.CTk):
             if header_max_width <= 50:
                 header_max_width = 350
             if logo_data:
-                self.after(
-                    0, partial(self._process_and_insert_image_ui, logo_data, 330, 200)
+                self._progress_queue.append(
+                    partial(self._process_and_insert_image_ui, logo_data, 330, 200)
                 )
             if header_data:
-                self.after(
-                    0,
+                self._progress_queue.append(
                     partial(
                         self._process_and_insert_image_ui,
                         header_data,
@@ -1517,7 +2233,7 @@ class ManifestDownloader(ctk.CTk):
 
     def download_manifest(self) -> None:
         selected_repo_list: List[str] = [
-            repo for repo, var in self.repo_vars.items() if var.get()
+            repo for repo in sorted(self.repos) if self.selected_repos.get(repo)
         ]
         if not selected_repo_list:
             messagebox.showwarning(
@@ -1553,15 +2269,7 @@ class ManifestDownloader(ctk.CTk):
             for appid_str in unique_appids_str:
                 game_name = self.appid_to_game.get(appid_str)
                 if not game_name and self.app_list_loaded_event.is_set():
-                    if found_app_info := next(
-                        (
-                            app
-                            for app in self.steam_app_list
-                            if str(app.get("appid")) == appid_str
-                        ),
-                        None,
-                    ):
-                        game_name = found_app_info.get("name")
+                    game_name = self._steam_app_names_by_appid.get(appid_str)
                 appids_to_download.append(
                     (appid_str, game_name if game_name else f"AppID_{appid_str}")
                 )
@@ -1575,17 +2283,29 @@ class ManifestDownloader(ctk.CTk):
         self.download_button.configure(state="disabled")
         self._clear_and_reinitialize_progress_area()
         self.cancel_search = False
-        threading.Thread(
-            target=self.run_batch_download,
-            args=(appids_to_download, selected_repo_list),
-            daemon=True,
-        ).start()
+        self._strict_mode_active = bool(self.strict_validation_var.get())
+        self._run_coroutine(
+            self.async_batch_download(appids_to_download, selected_repo_list),
+            on_done=lambda: self.download_button.configure(state="normal"),
+        )
 
-    def run_batch_download(
+    async def async_batch_download(
         self, appids_to_download: List[Tuple[str, str]], selected_repos: List[str]
     ) -> None:
-        download_loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(download_loop)
+        self._mirror_rate_limit_hits.clear()
+        self._mirror_benched_until.clear()
+        self._mirror_stats.clear()
+        self._missing_content_until.clear()
+        self._created_dirs.clear()
+        self._content_cache_dirs_used.clear()
+        # Cached commits are kept for re-runs, but bounded by age and total size.
+        await asyncio.get_running_loop().run_in_executor(
+            None,
+            prune_cache_dirs,
+            self.CONTENT_CACHE_DIR,
+            self.CONTENT_CACHE_MAX_AGE,
+            self.CONTENT_CACHE_MAX_BYTES,
+        )
         try:
             total_appids = len(appids_to_download)
             for i, (appid, game_name) in enumerate(appids_to_download):
@@ -1606,10 +2326,8 @@ class ManifestDownloader(ctk.CTk):
                     "blue",
                 )
                 collected_depots, output_path_or_processing_dir, source_was_branch = (
-                    download_loop.run_until_complete(
-                        self._perform_download_operations(
-                            appid, game_name, selected_repos
-                        )
+                    await self._perform_download_operations(
+                        appid, game_name, selected_repos
                     )
                 )
                 if self.cancel_search:
@@ -1625,16 +2343,21 @@ class ManifestDownloader(ctk.CTk):
                         output_path_or_processing_dir
                     ):
                         processing_dir = output_path_or_processing_dir
-                        lua_script: str = self.parse_vdf_to_lua(
-                            collected_depots, appid, processing_dir
+                        loop = asyncio.get_running_loop()
+                        lua_script: str = await loop.run_in_executor(
+                            None,
+                            partial(
+                                self.parse_vdf_to_lua,
+                                collected_depots,
+                                appid,
+                                processing_dir,
+                            ),
                         )
                         lua_file_path: str = os.path.join(
                             processing_dir, f"{appid}.lua"
                         )
                         try:
-                            download_loop.run_until_complete(
-                                self._write_lua_file(lua_file_path, lua_script)
-                            )
+                            await self._write_lua_file(lua_file_path, lua_script)
                             self.append_progress(
                                 tr(
                                     "\nGenerated LUA unlock script: {lua_file_path}"
@@ -1652,20 +2375,17 @@ class ManifestDownloader(ctk.CTk):
                                 "red",
                             )
 
-                        final_zip_path = self.zip_outcome(
+                        final_zip_path = await self.zip_outcome(
                             processing_dir, selected_repos
                         )
-                        if not collected_depots and self.strict_validation_var.get():
+                        if not collected_depots and self._strict_mode_active:
                             self.append_progress(
                                 tr(
                                     "\nWarning: Strict validation was ON, but no decryption keys were found/extracted. LUA script will be minimal and game may not work."
                                 ),
                                 "yellow",
                             )
-                        elif (
-                            not collected_depots
-                            and not self.strict_validation_var.get()
-                        ):
+                        elif not collected_depots and not self._strict_mode_active:
                             self.append_progress(
                                 tr(
                                     "\nNotice: No decryption keys found/extracted (strict validation was OFF). All downloaded files (if any) are included. Game may not work without keys."
@@ -1719,12 +2439,14 @@ class ManifestDownloader(ctk.CTk):
             self.append_progress(tr("\nBatch download process finished."), "green")
             self.after(0, self.display_downloaded_manifests)
         finally:
-            download_loop.close()
+            await self._save_github_json_cache()
             self.after(0, lambda: self.download_button.configure(state="normal"))
 
     async def _write_lua_file(self, path: str, content: str) -> None:
-        async with aiofiles.open(path, "w", encoding="utf-8") as lua_file:
-            await lua_file.write(content)
+        # aiofiles would spend a thread-pool hop each on open, write and close.
+        await asyncio.get_running_loop().run_in_executor(
+            None, write_text_file, path, content
+        )
 
     def print_colored_ui(self, text: str, color: str) -> None:
         self.append_progress(text, color)
@@ -1732,103 +2454,148 @@ class ManifestDownloader(ctk.CTk):
     def stack_Error(self, e: Exception) -> str:
         return f"{type(e).__name__}: {e}"
 
-    async def get(self, sha: str, path: str, repo: str) -> Optional[bytes]:
-        url_list: List[str] = [
-            f"https://gcore.jsdelivr.net/gh/{repo}@{sha}/{path}",
-            f"https://fastly.jsdelivr.net/gh/{repo}@{sha}/{path}",
-            f"https://cdn.jsdelivr.net/gh/{repo}@{sha}/{path}",
-            f"https://ghproxy.org/https://raw.githubusercontent.com/{repo}/{sha}/{path}",
-            f"https://raw.dgithub.xyz/{repo}/{sha}/{path}",
-            f"https://raw.githubusercontent.com/{repo}/{sha}/{path}",
-        ]
-        max_retries_per_url, overall_attempts = 1, 2
-        github_auth_headers = self._get_github_headers()
+    def _ensure_dir(self, directory: str) -> None:
+        # Thousands of files share a handful of folders; skip repeat makedirs calls.
+        if directory not in self._created_dirs:
+            os.makedirs(directory, exist_ok=True)
+            self._created_dirs.add(directory)
 
-        async with aiohttp.ClientSession() as session:
-            for attempt in range(overall_attempts):
-                if self.cancel_search:
-                    break
-                for url in url_list:
-                    if self.cancel_search:
-                        self.print_colored_ui(
-                            tr(
-                                "\nDownload cancelled by user for: {path} from {url_short}"
-                            ).format(path=path, url_short=url.split("/")[2]),
-                            "yellow",
-                        )
-                        return None
+    def _content_cache_dir(self, repo: str, sha: str) -> str:
+        return os.path.join(self.CONTENT_CACHE_DIR, repo.replace("/", "_"), sha)
 
-                    current_request_headers = {}
-                    if "raw.githubusercontent.com" in url and github_auth_headers:
-                        current_request_headers = github_auth_headers.copy()
-                        if (
-                            "Accept" in current_request_headers
-                            and "json" in current_request_headers["Accept"]
-                        ):
-                            del current_request_headers["Accept"]
+    def _content_cache_path(self, repo: str, sha: str, path: str) -> str:
+        return os.path.join(self._content_cache_dir(repo, sha), *path.split("/"))
 
-                    for retry_num in range(max_retries_per_url + 1):
-                        if self.cancel_search:
-                            return None
-                        try:
-                            self.print_colored_ui(
-                                f"... Trying {url.split('/')[2]} for {os.path.basename(path)} (Attempt {retry_num+1})",
-                                "default",
-                            )
-                            async with session.get(
-                                url,
-                                headers=current_request_headers,
-                                ssl=False,
-                                timeout=aiohttp.ClientTimeout(total=20),
-                            ) as r:
-                                if r.status == 200:
-                                    self.print_colored_ui(
-                                        f"OK from {url.split('/')[2]}", "green"
-                                    )
-                                    return await r.read()
-                                if r.status == 404:
-                                    self.print_colored_ui(
-                                        f"404 from {url.split('/')[2]}", "yellow"
-                                    )
-                                    break
-                                self.print_colored_ui(
-                                    f"Status {r.status} from {url.split('/')[2]}",
-                                    "yellow",
-                                )
-                        except (aiohttp.ClientError, asyncio.TimeoutError) as e_req:
-                            self.print_colored_ui(
-                                f"Error with {url.split('/')[2]}: {self.stack_Error(e_req)}",
-                                "yellow",
-                            )
-                        except KeyboardInterrupt:
-                            self.print_colored_ui(
-                                tr("\nDownload interrupted by user for: {path}").format(
-                                    path=path
-                                ),
-                                "yellow",
-                            )
-                            self.cancel_search = True
-                            return None
-                        if self.cancel_search:
-                            return None
-                        if retry_num < max_retries_per_url:
-                            await asyncio.sleep(0.5)
+    async def get_to_file(
+        self, session: aiohttp.ClientSession, sha: str, path: str, repo: str
+    ) -> Optional[str]:
+        # Mirror URLs are pinned to a commit SHA, so a cached copy never goes stale.
+        # Re-runs are served from here instead of being revalidated with ETags, so
+        # the cache must outlive each batch; prune_cache_dirs only bounds it.
+        cache_path = self._content_cache_path(repo, sha, path)
+        cache_dir = self._content_cache_dir(repo, sha)
+        if cache_dir not in self._content_cache_dirs_used:
+            self._content_cache_dirs_used.add(cache_dir)
+            # The cache limits evict by folder mtime, so mark this commit as used.
+            try:
+                os.utime(cache_dir)
+            except OSError:
+                pass
+        if os.path.isfile(cache_path):
+            self.print_colored_ui(
+                f"Using cached {os.path.basename(path)} (commit: {sha[:7]})",
+                "default",
+            )
+            return cache_path
+        # Another repo or key-file pass may ask for a file every mirror just failed on.
+        if self._missing_content_until.get(cache_path, 0.0) > time.monotonic():
+            self.print_colored_ui(
+                f"Skipping {os.path.basename(path)}: all mirrors failed for it moments ago",
+                "yellow",
+            )
+            return None
+        try:
+            self._ensure_dir(os.path.dirname(cache_path))
+        except OSError as e:
+            self.print_colored_ui(
+                f"Could not create cache folder for {path}: {self.stack_Error(e)}",
+                "red",
+            )
+            return None
 
-                if self.cancel_search:
-                    return None
-                if attempt < overall_attempts - 1:
+        url_list: List[str] = [
+            f"https://gcore.jsdelivr.net/gh/{repo}@{sha}/{path}",
+            f"https://fastly.jsdelivr.net/gh/{repo}@{sha}/{path}",
+            f"https://cdn.jsdelivr.net/gh/{repo}@{sha}/{path}",
+            f"https://ghproxy.org/https://raw.githubusercontent.com/{repo}/{sha}/{path}",
+            f"https://raw.dgithub.xyz/{repo}/{sha}/{path}",
+            f"https://raw.githubusercontent.com/{repo}/{sha}/{path}",
+        ]
+        overall_attempts = 3
+        github_auth_headers = self._get_github_headers()
+        raw_github_headers: Dict[str, str] = {}
+        if github_auth_headers:
+            raw_github_headers = github_auth_headers.copy()
+            if "json" in raw_github_headers.get("Accept", ""):
+                del raw_github_headers["Accept"]
+
+        for attempt in range(overall_attempts):
+            if self.cancel_search:
+                break
+            # Mirrors that answered 429 twice sit out the rest of the batch, and
+            # mirrors that just timed out sit out MIRROR_TIMEOUT_BENCH seconds.
+            now = time.monotonic()
+            candidate_urls = sorted(
+                [
+                    url
+                    for url in url_list
+                    if self._mirror_rate_limit_hits[url.split("/")[2]] < 2
+                    and self._mirror_benched_until.get(url.split("/")[2], 0.0) <= now
+                    and self._is_mirror_usable(url.split("/")[2])
+                ]
+                or url_list,
+                key=self._mirror_sort_key,
+            )
+            retry_after_hints: List[float] = []
+            failed_hosts: List[str] = []
+            part_path = await self._race_mirrors(
+                session,
+                candidate_urls,
+                os.path.basename(path),
+                raw_github_headers,
+                cache_path,
+                retry_after_hints,
+                failed_hosts,
+            )
+            if part_path is not None:
+                try:
+                    os.replace(part_path, cache_path)
+                    return cache_path
+                except OSError as e_replace:
+                    # A locked cache file (e.g. on Windows) counts as a failed cycle.
+                    remove_file_quietly(part_path)
                     self.print_colored_ui(
-                        tr(
-                            "\nRetrying download cycle for: {path} (Cycle {attempt_plus_2}/{overall_attempts})"
-                        ).format(
-                            path=path,
-                            attempt_plus_2=attempt + 2,
-                            overall_attempts=overall_attempts,
-                        ),
+                        f"Could not store {os.path.basename(path)} in the cache: {self.stack_Error(e_replace)}",
                         "yellow",
                     )
-                    await asyncio.sleep(1)
+            if self.cancel_search:
+                self.print_colored_ui(
+                    tr("\nDownload interrupted by user for: {path}").format(path=path),
+                    "yellow",
+                )
+                return None
+            if part_path is None and not failed_hosts:
+                # Every mirror answered 404 (or another 4xx): the file is not at
+                # this commit, and asking again would only get the same answer.
+                self._missing_content_until[cache_path] = (
+                    time.monotonic() + self.MISSING_CONTENT_TTL
+                )
+                self.print_colored_ui(
+                    f"{os.path.basename(path)} is missing on every mirror (commit: {sha[:7]})",
+                    "red",
+                )
+                return None
+            if attempt < overall_attempts - 1:
+                self.print_colored_ui(
+                    tr(
+                        "\nRetrying download cycle for: {path} (Cycle {attempt_plus_2}/{overall_attempts})"
+                    ).format(
+                        path=path,
+                        attempt_plus_2=attempt + 2,
+                        overall_attempts=overall_attempts,
+                    ),
+                    "yellow",
+                )
+                # Only throttling and transport trouble are worth waiting out.
+                if failed_hosts:
+                    backoff = max([min(2**attempt, 8)] + retry_after_hints)
+                    await asyncio.sleep(
+                        min(backoff, self.MAX_RETRY_DELAY) + random.random()
+                    )
         if not self.cancel_search:
+            self._missing_content_until[cache_path] = (
+                time.monotonic() + self.MISSING_CONTENT_TTL
+            )
             self.print_colored_ui(
                 tr(
                     "\nMaximum attempts exceeded for: {path}. File could not be downloaded."
@@ -1837,20 +2604,186 @@ class ManifestDownloader(ctk.CTk):
             )
         return None
 
+    async def _race_mirrors(
+        self,
+        session: aiohttp.ClientSession,
+        url_list: List[str],
+        file_name: str,
+        raw_github_headers: Dict[str, str],
+        cache_path: str,
+        retry_after_hints: List[float],
+        failed_hosts: List[str],
+    ) -> Optional[str]:
+        # Hedged requests: start the next mirror whenever the current ones fail or
+        # stay silent for MIRROR_HEDGE_DELAY, and keep the first body that arrives.
+        # A mirror that delivered body bytes during the last window is not silent,
+        # so large files streaming steadily do not trigger extra mirrors.
+        remaining_urls = enumerate(url_list)
+        pending: Set["asyncio.Task[Optional[str]]"] = set()
+        body_progress = asyncio.Event()
+        try:
+            while not self.cancel_search:
+                mirror_index, url = (
+                    (None, None)
+                    if pending and body_progress.is_set()
+                    else next(remaining_urls, (None, None))
+                )
+                body_progress.clear()
+                if url is not None:
+                    headers = (
+                        raw_github_headers if "raw.githubusercontent.com" in url else {}
+                    )
+                    pending.add(
+                        asyncio.ensure_future(
+                            self._fetch_from_mirror(
+                                session,
+                                url,
+                                file_name,
+                                headers,
+                                f"{cache_path}.{mirror_index}.part",
+                                retry_after_hints,
+                                failed_hosts,
+                                body_progress,
+                            )
+                        )
+                    )
+                if not pending:
+                    break
+                done, pending = await asyncio.wait(
+                    pending,
+                    timeout=self.MIRROR_HEDGE_DELAY,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                finished_paths = [
+                    task.result() for task in done if task.result() is not None
+                ]
+                if finished_paths:
+                    # Mirrors finishing in the same round each left a full copy behind.
+                    for extra_part_path in finished_paths[1:]:
+                        remove_file_quietly(extra_part_path)
+                    return finished_paths[0]
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                for result in await asyncio.gather(*pending, return_exceptions=True):
+                    if isinstance(result, str):
+                        remove_file_quietly(result)
+        return None
+
+    async def _fetch_from_mirror(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        file_name: str,
+        headers: Dict[str, str],
+        part_path: str,
+        retry_after_hints: List[float],
+        failed_hosts: List[str],
+        body_progress: asyncio.Event,
+    ) -> Optional[str]:
+        host = url.split("/")[2]
+        self.print_colored_ui(f"... Trying {host} for {file_name}", "default")
+        started = time.monotonic()
+        # A 404 or other 4xx means the file is missing, not that the mirror is unwell.
+        mirror_failed = True
+        try:
+            async with session.get(
+                url,
+                headers=headers,
+                ssl=False,
+                timeout=aiohttp.ClientTimeout(total=20),
+            ) as r:
+                if r.status == 200:
+                    async with aiofiles.open(
+                        part_path, "wb", buffering=self.WRITE_BUFFER_SIZE
+                    ) as f_part:
+                        async for chunk in r.content.iter_chunked(
+                            self.DOWNLOAD_CHUNK_SIZE
+                        ):
+                            body_progress.set()
+                            await f_part.write(chunk)
+                    self.print_colored_ui(f"OK from {host}", "green")
+                    self._record_mirror_result(host, True, time.monotonic() - started)
+                    return part_path
+                if r.status == 404:
+                    self.print_colored_ui(f"404 from {host}", "yellow")
+                else:
+                    self.print_colored_ui(f"Status {r.status} from {host}", "yellow")
+                mirror_failed = r.status == 429 or r.status >= 500
+                if r.status == 429:
+                    self._mirror_rate_limit_hits[host] += 1
+                if r.status in (429, 502, 503, 504):
+                    try:
+                        retry_after_hints.append(
+                            float(r.headers.get("Retry-After", ""))
+                        )
+                    except ValueError:
+                        pass
+        except (aiohttp.ClientError, asyncio.TimeoutError, OSError) as e_req:
+            self.print_colored_ui(
+                f"Error with {host}: {self.stack_Error(e_req)}", "yellow"
+            )
+            if isinstance(e_req, asyncio.TimeoutError):
+                self._mirror_benched_until[host] = (
+                    time.monotonic() + self.MIRROR_TIMEOUT_BENCH
+                )
+        except asyncio.CancelledError:
+            remove_file_quietly(part_path)
+            raise
+        if mirror_failed:
+            failed_hosts.append(host)
+            self._record_mirror_result(host, False, time.monotonic() - started)
+        remove_file_quietly(part_path)
+        return None
+
+    def _record_mirror_result(self, host: str, success: bool, latency: float) -> None:
+        if host not in self._mirror_stats:
+            self._mirror_stats[host] = (float(success), latency, 1)
+            return
+        success_rate, avg_latency, samples = self._mirror_stats[host]
+        alpha = self.MIRROR_STATS_ALPHA
+        self._mirror_stats[host] = (
+            success_rate + alpha * (float(success) - success_rate),
+            avg_latency + alpha * (latency - avg_latency),
+            samples + 1,
+        )
+
+    def _is_mirror_usable(self, host: str) -> bool:
+        # Only give up on a mirror once it has had a fair number of tries.
+        success_rate, _, samples = self._mirror_stats.get(host, (1.0, 0.0, 0))
+        return samples < 5 or success_rate >= self.MIN_MIRROR_SUCCESS_RATE
+
+    def _mirror_sort_key(self, url: str) -> float:
+        # Untried mirrors score as perfect so each gets a chance; the sort is
+        # stable, so ties keep the hard-coded preference order.
+        success_rate, avg_latency, _ = self._mirror_stats.get(
+            url.split("/")[2], (1.0, 0.0, 0)
+        )
+        return avg_latency / 20 - success_rate
+
     async def get_manifest(
-        self, sha: str, path: str, processing_dir: str, repo: str
+        self,
+        session: aiohttp.ClientSession,
+        sha: str,
+        path: str,
+        processing_dir: str,
+        repo: str,
+        existing_files: Set[str],
     ) -> List[Tuple[str, str]]:
         collected_depots: List[Tuple[str, str]] = []
+        loop = asyncio.get_running_loop()
+        path_lower = path.lower()
         try:
             file_save_path = os.path.join(processing_dir, path)
             parent_dir = os.path.dirname(file_save_path)
-            if parent_dir and not os.path.exists(parent_dir):
-                os.makedirs(parent_dir, exist_ok=True)
+            if parent_dir:
+                self._ensure_dir(parent_dir)
             content_bytes: Optional[bytes] = None
             should_download = True
 
-            if os.path.exists(file_save_path):
-                if path.lower().endswith(".manifest"):
+            if path in existing_files:
+                if path_lower.endswith(".manifest"):
                     should_download = False
                     self.print_colored_ui(
                         tr(
@@ -1858,12 +2791,11 @@ class ManifestDownloader(ctk.CTk):
                         ).format(path=path),
                         "default",
                     )
-                elif path.lower().endswith((".vdf")):
+                elif path_lower.endswith(".vdf"):
                     try:
-                        async with aiofiles.open(
-                            file_save_path, "rb"
-                        ) as f_existing_bytes:
-                            content_bytes = await f_existing_bytes.read()
+                        content_bytes = await loop.run_in_executor(
+                            None, read_file_bytes, file_save_path
+                        )
                         should_download = False
                         self.print_colored_ui(
                             tr(
@@ -1888,40 +2820,49 @@ class ManifestDownloader(ctk.CTk):
                     ).format(path=path, repo=repo, sha_short=sha[:7]),
                     "default",
                 )
-                content_bytes = await self.get(sha, path, repo)
-
-            if self.cancel_search:
-                return collected_depots
-            if content_bytes:
-                if should_download:
-                    async with aiofiles.open(file_save_path, "wb") as f_new:
-                        await f_new.write(content_bytes)
+                cached_file_path = await self.get_to_file(session, sha, path, repo)
+                if cached_file_path and not self.cancel_search:
+                    await loop.run_in_executor(
+                        None, partial(link_or_copy, cached_file_path, file_save_path)
+                    )
+                    existing_files.add(path)
                     self.print_colored_ui(
                         tr("\nFile downloaded and saved: {path}").format(path=path),
                         "green",
                     )
-                if path.lower().endswith((".vdf")):
-                    try:
-                        vdf_content_str = content_bytes.decode(
-                            encoding="utf-8", errors="ignore"
+                    if path_lower.endswith(".vdf"):
+                        # Key files are tiny: one executor hop beats aiofiles'
+                        # separate open/read/close round trips.
+                        content_bytes = await loop.run_in_executor(
+                            None, read_file_bytes, file_save_path
                         )
-                        depots_config = vdf.loads(vdf_content_str)
-                        depots_data = depots_config.get("depots", {})
-                        if not isinstance(depots_data, dict):
-                            depots_data = {}
-                        new_keys_count = 0
-                        for depot_id_str, depot_info in depots_data.items():
-                            if (
-                                isinstance(depot_info, dict)
+
+            if self.cancel_search:
+                return collected_depots
+            if content_bytes:
+                if path_lower.endswith(".vdf"):
+                    try:
+                        depot_keys: List[Tuple[str, str]] = [
+                            (m.group(1).decode("ascii"), m.group(2).decode("ascii"))
+                            for m in DEPOT_KEY_PATTERN.finditer(content_bytes)
+                        ]
+                        if not depot_keys:
+                            vdf_content_str = content_bytes.decode(
+                                encoding="utf-8", errors="ignore"
+                            )
+                            depots_config = vdf.loads(vdf_content_str)
+                            depots_data = depots_config.get("depots", {})
+                            if not isinstance(depots_data, dict):
+                                depots_data = {}
+                            depot_keys = [
+                                (str(depot_id_str), depot_info["DecryptionKey"])
+                                for depot_id_str, depot_info in depots_data.items()
+                                if isinstance(depot_info, dict)
                                 and "DecryptionKey" in depot_info
-                            ):
-                                key_tuple = (
-                                    str(depot_id_str),
-                                    depot_info["DecryptionKey"],
-                                )
-                                if key_tuple not in collected_depots:
-                                    collected_depots.append(key_tuple)
-                                    new_keys_count += 1
+                            ]
+                        # dict.fromkeys drops repeated keys in linear time, keeping order.
+                        collected_depots = list(dict.fromkeys(depot_keys))
+                        new_keys_count = len(collected_depots)
                         if new_keys_count > 0:
                             self.print_colored_ui(
                                 tr(
@@ -1929,10 +2870,10 @@ class ManifestDownloader(ctk.CTk):
                                 ).format(new_keys_count=new_keys_count, path=path),
                                 "magenta",
                             )
-                        elif not depots_data and os.path.basename(path.lower()) in [
-                            "key.vdf",
-                            "config.vdf",
-                        ]:
+                        elif (
+                            not depot_keys
+                            and path_lower.rpartition("/")[2] in KEY_FILE_NAMES
+                        ):
                             self.print_colored_ui(
                                 tr(
                                     "Warning: No 'depots' section or section is empty in {path}."
@@ -1946,7 +2887,7 @@ class ManifestDownloader(ctk.CTk):
                             ).format(path=path, error=self.stack_Error(e_vdf)),
                             "red",
                         )
-            elif should_download and not os.path.exists(file_save_path):
+            elif should_download and path not in existing_files:
                 self.print_colored_ui(
                     tr("\nFailed to download or find local file: {path}").format(
                         path=path
@@ -1970,9 +2911,34 @@ class ManifestDownloader(ctk.CTk):
             )
         return collected_depots
 
-    async def _fetch_branch_zip_content(
-        self, repo_full_name: str, app_id: str
-    ) -> Optional[bytes]:
+    async def _get_manifests_concurrently(
+        self,
+        session: aiohttp.ClientSession,
+        sha: str,
+        paths: List[str],
+        processing_dir: str,
+        repo: str,
+        existing_files: Set[str],
+    ) -> List[List[Tuple[str, str]]]:
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_DOWNLOADS)
+
+        async def bounded_get_manifest(path: str) -> List[Tuple[str, str]]:
+            async with semaphore:
+                if self.cancel_search:
+                    return []
+                return await self.get_manifest(
+                    session, sha, path, processing_dir, repo, existing_files
+                )
+
+        return await asyncio.gather(*(bounded_get_manifest(p) for p in paths))
+
+    async def _download_branch_zip(
+        self,
+        session: aiohttp.ClientSession,
+        repo_full_name: str,
+        app_id: str,
+        zip_path: str,
+    ) -> bool:
         api_url = f"https://api.github.com/repos/{repo_full_name}/zipball/{app_id}"
         github_auth_headers = self._get_github_headers()
         request_headers = {}
@@ -1983,65 +2949,151 @@ class ManifestDownloader(ctk.CTk):
             + (" " + tr("(with token)") if github_auth_headers else tr("(no token)")),
             "default",
         )
-        async with aiohttp.ClientSession() as session:
-            try:
-                async with session.get(
-                    api_url,
-                    headers=request_headers,
-                    timeout=aiohttp.ClientTimeout(total=600),
-                ) as r:
-                    if r.status == 200:
+        try:
+            async with session.get(
+                api_url,
+                headers=request_headers,
+                timeout=aiohttp.ClientTimeout(total=600),
+            ) as r:
+                if r.status == 200:
+                    self.print_colored_ui(
+                        tr(
+                            "Successfully started downloading branch zip for AppID {app_id} from {repo_full_name}."
+                        ).format(app_id=app_id, repo_full_name=repo_full_name),
+                        "green",
+                    )
+                    # Stream to a .part file so a large zip is never held in memory
+                    # and an interrupted download never looks like a finished one.
+                    part_path = f"{zip_path}.part"
+                    size = 0
+                    # Every aiofiles write is a thread-pool hop, so network chunks are
+                    # gathered and written about WRITE_BUFFER_SIZE bytes at a time.
+                    pending = bytearray()
+                    try:
+                        async with aiofiles.open(part_path, "wb") as f_zip:
+                            async for chunk in r.content.iter_chunked(
+                                self.DOWNLOAD_CHUNK_SIZE
+                            ):
+                                if self.cancel_search:
+                                    break
+                                pending += chunk
+                                size += len(chunk)
+                                if len(pending) >= self.WRITE_BUFFER_SIZE:
+                                    await f_zip.write(pending)
+                                    pending = bytearray()
+                            if pending and not self.cancel_search:
+                                await f_zip.write(pending)
+                        if self.cancel_search:
+                            remove_file_quietly(part_path)
+                            return False
+                        os.replace(part_path, zip_path)
+                    except (
+                        aiohttp.ClientError,
+                        asyncio.TimeoutError,
+                        asyncio.CancelledError,
+                    ):
+                        remove_file_quietly(part_path)
+                        raise
+                    except OSError as e_save:
+                        remove_file_quietly(part_path)
                         self.print_colored_ui(
                             tr(
-                                "Successfully started downloading branch zip for AppID {app_id} from {repo_full_name}."
-                            ).format(app_id=app_id, repo_full_name=repo_full_name),
-                            "green",
+                                "Failed to save downloaded branch zip to {final_branch_zip_path}: {error}"
+                            ).format(
+                                final_branch_zip_path=zip_path,
+                                error=self.stack_Error(e_save),
+                            ),
+                            "red",
                         )
-                        content = await r.read()
-                        self.print_colored_ui(
-                            tr(
-                                "Finished downloading branch zip content for AppID {app_id} (Size: {size_kb:.2f} KB)."
-                            ).format(app_id=app_id, size_kb=len(content) / 1024),
-                            "green",
+                        return False
+                    self.print_colored_ui(
+                        tr(
+                            "Finished downloading branch zip content for AppID {app_id} (Size: {size_kb:.2f} KB)."
+                        ).format(app_id=app_id, size_kb=size / 1024),
+                        "green",
+                    )
+                    return True
+                else:
+                    error_message = tr(
+                        "Failed to download branch zip (Status: {status}) from {url}"
+                    ).format(status=r.status, url=api_url)
+                    if r.status == 401 and github_auth_headers:
+                        error_message += " - " + tr(
+                            "Unauthorized. Check token permissions or if token is valid."
                         )
-                        return content
-                    else:
-                        error_message = tr(
-                            "Failed to download branch zip (Status: {status}) from {url}"
-                        ).format(status=r.status, url=api_url)
-                        if r.status == 401 and github_auth_headers:
-                            error_message += " - " + tr(
-                                "Unauthorized. Check token permissions or if token is valid."
+                    elif r.status == 404:
+                        error_message += " - " + tr(
+                            "Not Found. Ensure repository '{repo_full_name}' and branch '{app_id}' exist."
+                        ).format(repo_full_name=repo_full_name, app_id=app_id)
+                    self.print_colored_ui(error_message, "red")
+                    if r.status != 404:
+                        try:
+                            self.print_colored_ui(
+                                f"  Response: {(await r.text())[:200]}...", "red"
                             )
-                        elif r.status == 404:
-                            error_message += " - " + tr(
-                                "Not Found. Ensure repository '{repo_full_name}' and branch '{app_id}' exist."
-                            ).format(repo_full_name=repo_full_name, app_id=app_id)
-                        self.print_colored_ui(error_message, "red")
-                        if r.status != 404:
-                            try:
-                                self.print_colored_ui(
-                                    f"  Response: {(await r.text())[:200]}...", "red"
-                                )
-                            except:
-                                pass
-                        return None
-            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
-                self.print_colored_ui(
-                    tr(
-                        "Network or Timeout error downloading branch zip from {url}: {error}"
-                    ).format(url=api_url, error=self.stack_Error(e)),
-                    "red",
-                )
-                return None
-            except Exception as e:
-                self.print_colored_ui(
-                    tr("Unexpected error fetching branch zip {url}: {error}").format(
-                        url=api_url, error=self.stack_Error(e)
-                    ),
-                    "red",
-                )
-                return None
+                        except:
+                            pass
+                    return False
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            self.print_colored_ui(
+                tr(
+                    "Network or Timeout error downloading branch zip from {url}: {error}"
+                ).format(url=api_url, error=self.stack_Error(e)),
+                "red",
+            )
+            return False
+        except Exception as e:
+            self.print_colored_ui(
+                tr("Unexpected error fetching branch zip {url}: {error}").format(
+                    url=api_url, error=self.stack_Error(e)
+                ),
+                "red",
+            )
+            return False
+
+    async def _prefetch_repo_lookups(
+        self,
+        session: aiohttp.ClientSession,
+        selected_repos: List[str],
+        app_id: str,
+        github_auth_headers: Optional[Dict[str, str]],
+    ) -> None:
+        # Lookups cost API calls for repos that may never be reached, which the
+        # unauthenticated limit of 60 an hour cannot afford.
+        if not github_auth_headers:
+            return
+        api_headers = github_auth_headers.copy()
+        await asyncio.gather(
+            *(
+                self._prefetch_repo_lookup(session, repo_full_name, app_id, api_headers)
+                for repo_full_name in selected_repos
+                if self.repos.get(repo_full_name) == "Decrypted"
+            ),
+            return_exceptions=True,
+        )
+
+    async def _prefetch_repo_lookup(
+        self,
+        session: aiohttp.ClientSession,
+        repo_full_name: str,
+        app_id: str,
+        api_headers: Dict[str, str],
+    ) -> None:
+        branch_status, branch_json = await self._get_github_json(
+            session,
+            f"https://api.github.com/repos/{repo_full_name}/branches/{app_id}",
+            api_headers,
+            15,
+        )
+        if branch_status != 200:
+            return
+        tree_url_base = (
+            branch_json.get("commit", {}).get("commit", {}).get("tree", {}).get("url")
+        )
+        if tree_url_base:
+            await self._get_github_json(
+                session, f"{tree_url_base}?recursive=1", api_headers, 30
+            )
 
     async def _perform_download_operations(
         self, app_id_input: str, game_name: str, selected_repos: List[str]
@@ -2057,13 +3109,15 @@ class ManifestDownloader(ctk.CTk):
             return [], None, False
         app_id = app_id_match.group(0)
         sanitized_game_name = (
-            "".join(c if c.isalnum() or c in " -_" else "" for c in game_name).strip()
-            or f"AppID_{app_id}"
+            GAME_NAME_STRIP_PATTERN.sub("", game_name).strip() or f"AppID_{app_id}"
         )
         output_base_dir = self.settings_manager.get("download_path")
         final_output_name_stem = f"{sanitized_game_name} - {app_id}"
+        loop = asyncio.get_running_loop()
         try:
-            os.makedirs(output_base_dir, exist_ok=True)
+            await loop.run_in_executor(
+                None, partial(os.makedirs, output_base_dir, exist_ok=True)
+            )
         except OSError as e:
             self.print_colored_ui(
                 tr(
@@ -2075,59 +3129,69 @@ class ManifestDownloader(ctk.CTk):
 
         overall_collected_depots: List[Tuple[str, str]] = []
         github_auth_headers = self._get_github_headers()
+        # Encrypted repos rarely yield usable keys, so only fall back to them last.
+        selected_repos = sorted(
+            selected_repos, key=lambda repo: self.repos.get(repo) == "Encrypted"
+        )
 
-        for repo_full_name in selected_repos:
-            if self.cancel_search:
-                self.print_colored_ui(
-                    tr(
-                        "\nDownload process cancelled by user before processing repo: {repo_full_name}."
-                    ).format(repo_full_name=repo_full_name),
-                    "yellow",
-                )
-                return overall_collected_depots, None, False
-            repo_type = self.repos.get(repo_full_name)
-            if not repo_type:
-                self.print_colored_ui(
-                    tr(
-                        "Repository {repo_full_name} type not found in local list. Skipping."
-                    ).format(repo_full_name=repo_full_name),
-                    "yellow",
-                )
-                continue
-
-            if repo_type == "Branch":
-                self.print_colored_ui(
-                    tr(
-                        "\nProcessing BRANCH repository: {repo_full_name} for AppID: {app_id}"
-                    ).format(repo_full_name=repo_full_name, app_id=app_id),
-                    "cyan",
-                )
-                final_branch_zip_path = os.path.join(
-                    output_base_dir, f"{final_output_name_stem}.zip"
-                )
-                if os.path.exists(final_branch_zip_path):
+        async with self._create_http_session() as session:
+            # With a token, resolve every non-branch repo's branch and tree at once;
+            # the priority loop below then reads cached answers instead of waiting.
+            await self._prefetch_repo_lookups(
+                session, selected_repos, app_id, github_auth_headers
+            )
+            # Repos are tried one at a time and the loop stops at the first usable
+            # one, so no fetch spans repos. The content cache is keyed by repo and
+            # commit: it saves re-runs and repeat passes, not requests across repos.
+            for repo_full_name in selected_repos:
+                if self.cancel_search:
                     self.print_colored_ui(
                         tr(
-                            "Branch ZIP already exists: {final_branch_zip_path}. Skipping download for this repo."
-                        ).format(final_branch_zip_path=final_branch_zip_path),
-                        "blue",
+                            "\nDownload process cancelled by user before processing repo: {repo_full_name}."
+                        ).format(repo_full_name=repo_full_name),
+                        "yellow",
                     )
-                    return [], final_branch_zip_path, True
-                zip_content = await self._fetch_branch_zip_content(
-                    repo_full_name, app_id
-                )
-                if self.cancel_search:
+                    return overall_collected_depots, None, False
+                repo_type = self.repos.get(repo_full_name)
+                if not repo_type:
                     self.print_colored_ui(
                         tr(
-                            "\nDownload cancelled during branch zip fetch from {repo_full_name}."
+                            "Repository {repo_full_name} type not found in local list. Skipping."
                         ).format(repo_full_name=repo_full_name),
                         "yellow",
                     )
-                    return [], None, False
-                if zip_content:
-                    try:
-                        async with aiofiles.open(final_branch_zip_path, "wb") as f_zip:
-                            await f_zip.write(zip_content)
+                    continue
+
+                if repo_type == "Branch":
+                    self.print_colored_ui(
+                        tr(
+                            "\nProcessing BRANCH repository: {repo_full_name} for AppID: {app_id}"
+                        ).format(repo_full_name=repo_full_name, app_id=app_id),
+                        "cyan",
+                    )
+                    final_branch_zip_path = os.path.join(
+                        output_base_dir, f"{final_output_name_stem}.zip"
+                    )
+                    if os.path.exists(final_branch_zip_path):
+                        self.print_colored_ui(
+                            tr(
+                                "Branch ZIP already exists: {final_branch_zip_path}. Skipping download for this repo."
+                            ).format(final_branch_zip_path=final_branch_zip_path),
+                            "blue",
+                        )
+                        return [], final_branch_zip_path, True
+                    zip_saved = await self._download_branch_zip(
+                        session, repo_full_name, app_id, final_branch_zip_path
+                    )
+                    if self.cancel_search:
+                        self.print_colored_ui(
+                            tr(
+                                "\nDownload cancelled during branch zip fetch from {repo_full_name}."
+                            ).format(repo_full_name=repo_full_name),
+                            "yellow",
+                        )
+                        return [], None, False
+                    if zip_saved:
                         self.print_colored_ui(
                             tr(
                                 "Successfully saved branch download from {repo_full_name} to {final_branch_zip_path}"
@@ -2138,351 +3202,338 @@ class ManifestDownloader(ctk.CTk):
                             "green",
                         )
                         return [], final_branch_zip_path, True
-                    except Exception as e_save:
+                    else:
                         self.print_colored_ui(
                             tr(
-                                "Failed to save downloaded branch zip to {final_branch_zip_path}: {error}"
-                            ).format(
-                                final_branch_zip_path=final_branch_zip_path,
-                                error=self.stack_Error(e_save),
-                            ),
-                            "red",
+                                "Failed to download content for branch repo {repo_full_name}, AppID {app_id}. Trying next selected repo."
+                            ).format(repo_full_name=repo_full_name, app_id=app_id),
+                            "yellow",
                         )
-                else:
+                    continue
+
+                processing_dir_non_branch = os.path.join(
+                    output_base_dir, f"_{final_output_name_stem}_temp"
+                )
+                try:
+                    await loop.run_in_executor(
+                        None,
+                        partial(os.makedirs, processing_dir_non_branch, exist_ok=True),
+                    )
+                except OSError as e_mkdir:
                     self.print_colored_ui(
                         tr(
-                            "Failed to download content for branch repo {repo_full_name}, AppID {app_id}. Trying next selected repo."
-                        ).format(repo_full_name=repo_full_name, app_id=app_id),
-                        "yellow",
+                            "Error creating temporary processing directory {processing_dir_non_branch}: {error}. Skipping repo {repo_full_name}."
+                        ).format(
+                            processing_dir_non_branch=processing_dir_non_branch,
+                            error=self.stack_Error(e_mkdir),
+                            repo_full_name=repo_full_name,
+                        ),
+                        "red",
                     )
-                continue
+                    continue
+
+                existing_files = await loop.run_in_executor(
+                    None, list_relative_files, processing_dir_non_branch
+                )
 
-            processing_dir_non_branch = os.path.join(
-                output_base_dir, f"_{final_output_name_stem}_temp"
-            )
-            try:
-                os.makedirs(processing_dir_non_branch, exist_ok=True)
-            except OSError as e_mkdir:
                 self.print_colored_ui(
                     tr(
-                        "Error creating temporary processing directory {processing_dir_non_branch}: {error}. Skipping repo {repo_full_name}."
+                        "\nSearching NON-BRANCH repository: {repo_full_name} for AppID: {app_id} (Type: {repo_type})"
                     ).format(
-                        processing_dir_non_branch=processing_dir_non_branch,
-                        error=self.stack_Error(e_mkdir),
                         repo_full_name=repo_full_name,
+                        app_id=app_id,
+                        repo_type=repo_type,
                     ),
-                    "red",
+                    "cyan",
                 )
-                continue
-
-            self.print_colored_ui(
-                tr(
-                    "\nSearching NON-BRANCH repository: {repo_full_name} for AppID: {app_id} (Type: {repo_type})"
-                ).format(
-                    repo_full_name=repo_full_name, app_id=app_id, repo_type=repo_type
-                ),
-                "cyan",
-            )
-            branch_api_url = (
-                f"https://api.github.com/repos/{repo_full_name}/branches/{app_id}"
-            )
-            repo_specific_collected_depots: List[Tuple[str, str]] = []
+                branch_api_url = (
+                    f"https://api.github.com/repos/{repo_full_name}/branches/{app_id}"
+                )
+                # Insertion-ordered set of keys, so merging stays linear.
+                repo_specific_collected_depots: Dict[Tuple[str, str], None] = {}
 
-            async with aiohttp.ClientSession() as session:
                 try:
                     current_api_headers = (
                         github_auth_headers.copy() if github_auth_headers else {}
                     )
-                    async with session.get(
-                        branch_api_url,
-                        headers=current_api_headers,
-                        ssl=False,
-                        timeout=aiohttp.ClientTimeout(total=15),
-                    ) as r_branch:
-                        if r_branch.status != 200:
-                            status_msg = tr(
-                                "AppID {app_id} not found as a branch in {repo_full_name} (Status: {status})."
+                    branch_status, branch_json = await self._get_github_json(
+                        session, branch_api_url, current_api_headers, 15
+                    )
+                    if branch_status == self.GITHUB_RATE_LIMITED:
+                        self._report_github_rate_limit(
+                            repo_full_name, bool(current_api_headers)
+                        )
+                        continue
+                    if branch_status != 200:
+                        status_msg = tr(
+                            "AppID {app_id} not found as a branch in {repo_full_name} (Status: {status})."
+                        ).format(
+                            app_id=app_id,
+                            repo_full_name=repo_full_name,
+                            status=branch_status,
+                        )
+                        if branch_status == 401 and current_api_headers:
+                            status_msg += " " + tr("Auth failed. Check token.")
+                        elif branch_status == 404:
+                            status_msg += " " + tr("Branch likely does not exist.")
+                        self.print_colored_ui(
+                            status_msg + tr(" Trying next selected repo."), "yellow"
+                        )
+                        continue
+
+                    commit_data = branch_json.get("commit", {})
+                    sha = commit_data.get("sha")
+                    tree_url_base = (
+                        commit_data.get("commit", {}).get("tree", {}).get("url")
+                    )
+                    commit_date = (
+                        commit_data.get("commit", {})
+                        .get("author", {})
+                        .get("date", tr("Unknown date"))
+                    )
+                    if not sha or not tree_url_base:
+                        self.print_colored_ui(
+                            tr(
+                                "Invalid branch data (missing SHA or tree URL) for {repo_full_name}/{app_id}. Trying next selected repo."
+                            ).format(repo_full_name=repo_full_name, app_id=app_id),
+                            "red",
+                        )
+                        continue
+
+                    tree_url_recursive = f"{tree_url_base}?recursive=1"
+                    tree_status, tree_json = await self._get_github_json(
+                        session, tree_url_recursive, current_api_headers, 30
+                    )
+                    if tree_status == self.GITHUB_RATE_LIMITED:
+                        self._report_github_rate_limit(
+                            repo_full_name, bool(current_api_headers)
+                        )
+                        continue
+                    if tree_status != 200:
+                        self.print_colored_ui(
+                            tr(
+                                "Failed to get file tree data for {repo_full_name}/{app_id} (Commit SHA: {sha}, Status: {status}). Trying next selected repo."
                             ).format(
+                                repo_full_name=repo_full_name,
                                 app_id=app_id,
+                                sha=sha[:7],
+                                status=tree_status,
+                            ),
+                            "red",
+                        )
+                        continue
+                    if tree_json.get("truncated"):
+                        self.print_colored_ui(
+                            tr(
+                                "Warning: File tree for {repo_full_name}/{app_id} is TRUNCATED by GitHub API. Some files may be missed. Consider repos with smaller AppID branches."
+                            ).format(repo_full_name=repo_full_name, app_id=app_id),
+                            "yellow",
+                        )
+                    tree_items = tree_json.get("tree", [])
+                    if not tree_items:
+                        self.print_colored_ui(
+                            tr(
+                                "No files found in tree for {repo_full_name}/{app_id} (Commit SHA: {sha}). Trying next selected repo."
+                            ).format(
                                 repo_full_name=repo_full_name,
-                                status=r_branch.status,
-                            )
-                            if r_branch.status == 401 and current_api_headers:
-                                status_msg += " " + tr("Auth failed. Check token.")
-                            elif r_branch.status == 404:
-                                status_msg += " " + tr("Branch likely does not exist.")
-                            self.print_colored_ui(
-                                status_msg + tr(" Trying next selected repo."), "yellow"
-                            )
-                            continue
+                                app_id=app_id,
+                                sha=sha[:7],
+                            ),
+                            "yellow",
+                        )
+                        continue
+
+                    files_downloaded_or_processed_this_repo = False
+                    key_file_found_and_processed_successfully = False
 
-                        branch_json = await r_branch.json()
-                        commit_data = branch_json.get("commit", {})
-                        sha = commit_data.get("sha")
-                        tree_url_base = (
-                            commit_data.get("commit", {}).get("tree", {}).get("url")
+                    if self._strict_mode_active:
+                        self.print_colored_ui(
+                            tr(
+                                "STRICT MODE: Processing branch {app_id} in {repo_full_name} (Commit: {sha_short}, Date: {commit_date})"
+                            ).format(
+                                app_id=app_id,
+                                repo_full_name=repo_full_name,
+                                sha_short=sha[:7],
+                                commit_date=commit_date,
+                            ),
+                            "magenta",
                         )
-                        commit_date = (
-                            commit_data.get("commit", {})
-                            .get("author", {})
-                            .get("date", tr("Unknown date"))
+                        key_file_paths_in_tree = {}
+                        manifest_paths = []
+                        for item in tree_items:
+                            if item.get("type") == "blob":
+                                item_path = item.get("path", "")
+                                item_path_lower = item_path.lower()
+                                if item_path_lower.endswith(".manifest"):
+                                    manifest_paths.append(item_path)
+                                    continue
+                                item_basename_lower = item_path_lower.rpartition("/")[2]
+                                if item_basename_lower in KEY_FILE_NAMES:
+                                    key_file_paths_in_tree[item_path] = (
+                                        item_basename_lower
+                                    )
+                        prioritized_key_files = sorted(
+                            key_file_paths_in_tree.keys(),
+                            key=lambda p: (
+                                key_file_paths_in_tree[p] != "key.vdf",
+                                p,
+                            ),
                         )
-                        if not sha or not tree_url_base:
+                        if len(prioritized_key_files) > 1:
+                            # Fetch every candidate at once; the ordered loop
+                            # below then reads them from the content cache.
+                            await asyncio.gather(
+                                *(
+                                    self.get_to_file(
+                                        session, sha, key_path, repo_full_name
+                                    )
+                                    for key_path in prioritized_key_files
+                                    if key_path not in existing_files
+                                ),
+                                # A failed prefetch is retried per file below.
+                                return_exceptions=True,
+                            )
+                        for actual_key_file_path in prioritized_key_files:
+                            if self.cancel_search:
+                                break
+                            key_short_name = key_file_paths_in_tree[
+                                actual_key_file_path
+                            ]
                             self.print_colored_ui(
                                 tr(
-                                    "Invalid branch data (missing SHA or tree URL) for {repo_full_name}/{app_id}. Trying next selected repo."
-                                ).format(repo_full_name=repo_full_name, app_id=app_id),
-                                "red",
+                                    "STRICT: Found potential key file '{key_short_name}' at: {actual_key_file_path}. Attempting to process."
+                                ).format(
+                                    key_short_name=key_short_name,
+                                    actual_key_file_path=actual_key_file_path,
+                                ),
+                                "default",
                             )
-                            continue
-
-                        tree_url_recursive = f"{tree_url_base}?recursive=1"
-                        async with session.get(
-                            tree_url_recursive,
-                            headers=current_api_headers,
-                            ssl=False,
-                            timeout=aiohttp.ClientTimeout(total=30),
-                        ) as r_tree:
-                            if r_tree.status != 200:
-                                self.print_colored_ui(
-                                    tr(
-                                        "Failed to get file tree data for {repo_full_name}/{app_id} (Commit SHA: {sha}, Status: {status}). Trying next selected repo."
-                                    ).format(
-                                        repo_full_name=repo_full_name,
-                                        app_id=app_id,
-                                        sha=sha[:7],
-                                        status=r_tree.status,
-                                    ),
-                                    "red",
-                                )
-                                continue
-                            tree_json = await r_tree.json()
-                            if tree_json.get("truncated"):
-                                self.print_colored_ui(
-                                    tr(
-                                        "Warning: File tree for {repo_full_name}/{app_id} is TRUNCATED by GitHub API. Some files may be missed. Consider repos with smaller AppID branches."
-                                    ).format(
-                                        repo_full_name=repo_full_name, app_id=app_id
-                                    ),
-                                    "yellow",
-                                )
-                            tree_items = tree_json.get("tree", [])
-                            if not tree_items:
-                                self.print_colored_ui(
-                                    tr(
-                                        "No files found in tree for {repo_full_name}/{app_id} (Commit SHA: {sha}). Trying next selected repo."
-                                    ).format(
-                                        repo_full_name=repo_full_name,
-                                        app_id=app_id,
-                                        sha=sha[:7],
-                                    ),
-                                    "yellow",
+                            depot_keys_from_vdf = await self.get_manifest(
+                                session,
+                                sha,
+                                actual_key_file_path,
+                                processing_dir_non_branch,
+                                repo_full_name,
+                                existing_files,
+                            )
+                            if depot_keys_from_vdf:
+                                repo_specific_collected_depots.update(
+                                    dict.fromkeys(depot_keys_from_vdf)
                                 )
-                                continue
-
-                            files_downloaded_or_processed_this_repo = False
-                            key_file_found_and_processed_successfully = False
-
-                            if self.strict_validation_var.get():
+                                (
+                                    files_downloaded_or_processed_this_repo,
+                                    key_file_found_and_processed_successfully,
+                                ) = (True, True)
                                 self.print_colored_ui(
                                     tr(
-                                        "STRICT MODE: Processing branch {app_id} in {repo_full_name} (Commit: {sha_short}, Date: {commit_date})"
-                                    ).format(
-                                        app_id=app_id,
-                                        repo_full_name=repo_full_name,
-                                        sha_short=sha[:7],
-                                        commit_date=commit_date,
-                                    ),
-                                    "magenta",
-                                )
-                                key_file_paths_in_tree = {}
-                                for item in tree_items:
-                                    if item.get("type") == "blob":
-                                        item_path, item_basename_lower = item.get(
-                                            "path", ""
-                                        ), os.path.basename(
-                                            item.get("path", "").lower()
-                                        )
-                                        if item_basename_lower in [
-                                            "key.vdf",
-                                            "config.vdf",
-                                        ]:
-                                            key_file_paths_in_tree[item_path] = (
-                                                item_basename_lower
-                                            )
-                                prioritized_key_files = sorted(
-                                    key_file_paths_in_tree.keys(),
-                                    key=lambda p: (
-                                        key_file_paths_in_tree[p] != "key.vdf",
-                                        p,
-                                    ),
+                                        "STRICT: Successfully processed keys from '{actual_key_file_path}'."
+                                    ).format(actual_key_file_path=actual_key_file_path),
+                                    "green",
                                 )
-                                for actual_key_file_path in prioritized_key_files:
-                                    if self.cancel_search:
-                                        break
-                                    key_short_name = key_file_paths_in_tree[
-                                        actual_key_file_path
-                                    ]
-                                    self.print_colored_ui(
-                                        tr(
-                                            "STRICT: Found potential key file '{key_short_name}' at: {actual_key_file_path}. Attempting to process."
-                                        ).format(
-                                            key_short_name=key_short_name,
-                                            actual_key_file_path=actual_key_file_path,
-                                        ),
-                                        "default",
-                                    )
-                                    depot_keys_from_vdf = await self.get_manifest(
-                                        sha,
-                                        actual_key_file_path,
-                                        processing_dir_non_branch,
-                                        repo_full_name,
-                                    )
-                                    if depot_keys_from_vdf:
-                                        for dk in depot_keys_from_vdf:
-                                            if dk not in repo_specific_collected_depots:
-                                                repo_specific_collected_depots.append(
-                                                    dk
-                                                )
-                                        (
-                                            files_downloaded_or_processed_this_repo,
-                                            key_file_found_and_processed_successfully,
-                                        ) = (True, True)
-                                        self.print_colored_ui(
-                                            tr(
-                                                "STRICT: Successfully processed keys from '{actual_key_file_path}'."
-                                            ).format(
-                                                actual_key_file_path=actual_key_file_path
-                                            ),
-                                            "green",
-                                        )
-                                        if key_short_name == "key.vdf":
-                                            break
-                                if self.cancel_search:
+                                if key_short_name == "key.vdf":
                                     break
-                                if not key_file_found_and_processed_successfully:
-                                    self.print_colored_ui(
-                                        tr(
-                                            "STRICT: No Key.vdf or Config.vdf found or processed successfully for keys in {repo_full_name}/{app_id}. This repo may not yield usable decryption data in strict mode. Manifests will still be downloaded if found."
-                                        ).format(
-                                            repo_full_name=repo_full_name, app_id=app_id
-                                        ),
-                                        "yellow",
-                                    )
-                                for item in tree_items:
-                                    if self.cancel_search:
-                                        break
-                                    item_path = item.get("path", "")
-                                    if item.get(
-                                        "type"
-                                    ) == "blob" and item_path.lower().endswith(
-                                        ".manifest"
-                                    ):
-                                        await self.get_manifest(
-                                            sha,
-                                            item_path,
-                                            processing_dir_non_branch,
-                                            repo_full_name,
-                                        )
-                                        if os.path.exists(
-                                            os.path.join(
-                                                processing_dir_non_branch, item_path
-                                            )
-                                        ):
-                                            files_downloaded_or_processed_this_repo = (
-                                                True
-                                            )
-                            else:  # NON-STRICT
-                                self.print_colored_ui(
-                                    tr(
-                                        "NON-STRICT MODE: Downloading all files from branch {app_id} in {repo_full_name} (Commit: {sha_short}, Date: {commit_date})"
-                                    ).format(
-                                        app_id=app_id,
-                                        repo_full_name=repo_full_name,
-                                        sha_short=sha[:7],
-                                        commit_date=commit_date,
-                                    ),
-                                    "magenta",
-                                )
-                                for item in tree_items:
-                                    if self.cancel_search:
-                                        break
-                                    item_path = item.get("path", "")
-                                    if item.get("type") == "blob":
-                                        keys_from_file = await self.get_manifest(
-                                            sha,
-                                            item_path,
-                                            processing_dir_non_branch,
-                                            repo_full_name,
-                                        )
-                                        if keys_from_file:
-                                            for dk in keys_from_file:
-                                                if (
-                                                    dk
-                                                    not in repo_specific_collected_depots
-                                                ):
-                                                    repo_specific_collected_depots.append(
-                                                        dk
-                                                    )
-                                        if os.path.exists(
-                                            os.path.join(
-                                                processing_dir_non_branch, item_path
-                                            )
-                                        ):
-                                            files_downloaded_or_processed_this_repo = (
-                                                True
-                                            )
+                        if self.cancel_search:
+                            break
+                        if not key_file_found_and_processed_successfully:
+                            self.print_colored_ui(
+                                tr(
+                                    "STRICT: No Key.vdf or Config.vdf found or processed successfully for keys in {repo_full_name}/{app_id}. This repo may not yield usable decryption data in strict mode. Manifests will still be downloaded if found."
+                                ).format(repo_full_name=repo_full_name, app_id=app_id),
+                                "yellow",
+                            )
+                        await self._get_manifests_concurrently(
+                            session,
+                            sha,
+                            manifest_paths,
+                            processing_dir_non_branch,
+                            repo_full_name,
+                            existing_files,
+                        )
+                        if any(p in existing_files for p in manifest_paths):
+                            files_downloaded_or_processed_this_repo = True
+                    else:  # NON-STRICT
+                        self.print_colored_ui(
+                            tr(
+                                "NON-STRICT MODE: Downloading all files from branch {app_id} in {repo_full_name} (Commit: {sha_short}, Date: {commit_date})"
+                            ).format(
+                                app_id=app_id,
+                                repo_full_name=repo_full_name,
+                                sha_short=sha[:7],
+                                commit_date=commit_date,
+                            ),
+                            "magenta",
+                        )
+                        blob_paths = [
+                            item.get("path", "")
+                            for item in tree_items
+                            if item.get("type") == "blob"
+                        ]
+                        keys_per_file = await self._get_manifests_concurrently(
+                            session,
+                            sha,
+                            blob_paths,
+                            processing_dir_non_branch,
+                            repo_full_name,
+                            existing_files,
+                        )
+                        for keys_from_file in keys_per_file:
+                            repo_specific_collected_depots.update(
+                                dict.fromkeys(keys_from_file)
+                            )
+                        if any(p in existing_files for p in blob_paths):
+                            files_downloaded_or_processed_this_repo = True
 
-                            if self.cancel_search:
-                                self.print_colored_ui(
-                                    tr(
-                                        "\nDownload cancelled during file processing of {repo_full_name}."
-                                    ).format(repo_full_name=repo_full_name),
-                                    "yellow",
-                                )
-                                break
+                    if self.cancel_search:
+                        self.print_colored_ui(
+                            tr(
+                                "\nDownload cancelled during file processing of {repo_full_name}."
+                            ).format(repo_full_name=repo_full_name),
+                            "yellow",
+                        )
+                        break
 
-                            repo_considered_successful = False
-                            if not self.cancel_search:
-                                if self.strict_validation_var.get():
-                                    repo_considered_successful = (
-                                        bool(repo_specific_collected_depots)
-                                        and files_downloaded_or_processed_this_repo
-                                    )
-                                else:
-                                    repo_considered_successful = (
-                                        files_downloaded_or_processed_this_repo
-                                    )
+                    repo_considered_successful = False
+                    if not self.cancel_search:
+                        if self._strict_mode_active:
+                            repo_considered_successful = (
+                                bool(repo_specific_collected_depots)
+                                and files_downloaded_or_processed_this_repo
+                            )
+                        else:
+                            repo_considered_successful = (
+                                files_downloaded_or_processed_this_repo
+                            )
 
-                            if repo_considered_successful:
-                                self.print_colored_ui(
-                                    tr(
-                                        "\nData successfully processed for AppID {app_id} from {repo_full_name}. (Commit Date: {commit_date})"
-                                    ).format(
-                                        app_id=app_id,
-                                        repo_full_name=repo_full_name,
-                                        commit_date=commit_date,
-                                    ),
-                                    "green",
-                                )
-                                for dk_tuple in repo_specific_collected_depots:
-                                    if dk_tuple not in overall_collected_depots:
-                                        overall_collected_depots.append(dk_tuple)
-                                return (
-                                    overall_collected_depots,
-                                    processing_dir_non_branch,
-                                    False,
-                                )
-                            else:
-                                if not self.cancel_search:
-                                    self.print_colored_ui(
-                                        tr(
-                                            "AppID {app_id} could not be successfully processed from {repo_full_name} with current settings. Files in processing dir (if any) will be from this attempt. Trying next selected repo."
-                                        ).format(
-                                            app_id=app_id, repo_full_name=repo_full_name
-                                        ),
-                                        "yellow",
-                                    )
+                    if repo_considered_successful:
+                        self.print_colored_ui(
+                            tr(
+                                "\nData successfully processed for AppID {app_id} from {repo_full_name}. (Commit Date: {commit_date})"
+                            ).format(
+                                app_id=app_id,
+                                repo_full_name=repo_full_name,
+                                commit_date=commit_date,
+                            ),
+                            "green",
+                        )
+                        already_collected = set(overall_collected_depots)
+                        overall_collected_depots.extend(
+                            dk_tuple
+                            for dk_tuple in repo_specific_collected_depots
+                            if dk_tuple not in already_collected
+                        )
+                        return (
+                            overall_collected_depots,
+                            processing_dir_non_branch,
+                            False,
+                        )
+                    else:
+                        if not self.cancel_search:
+                            self.print_colored_ui(
+                                tr(
+                                    "AppID {app_id} could not be successfully processed from {repo_full_name} with current settings. Files in processing dir (if any) will be from this attempt. Trying next selected repo."
+                                ).format(app_id=app_id, repo_full_name=repo_full_name),
+                                "yellow",
+                            )
                 except (
                     aiohttp.ClientError,
                     asyncio.TimeoutError,
@@ -2505,8 +3556,8 @@ class ManifestDownloader(ctk.CTk):
                     )
                     self.cancel_search = True
                     break
-            if self.cancel_search:
-                break
+                if self.cancel_search:
+                    break
 
         if self.cancel_search:
             self.print_colored_ui(
@@ -2526,81 +3577,62 @@ class ManifestDownloader(ctk.CTk):
         self, depot_info: List[Tuple[str, str]], appid: str, processing_dir: str
     ) -> str:
         lua_lines: List[str] = [f"addappid({appid})"]
-        processed_depots_for_setmanifest = set()
-
-        for depot_id, decryption_key in depot_info:
-            lua_lines.append(f'addappid({depot_id},1,"{decryption_key}")')
-            processed_depots_for_setmanifest.add(depot_id)
+        lua_lines.extend(
+            f'addappid({depot_id},1,"{decryption_key}")'
+            for depot_id, decryption_key in depot_info
+        )
+        processed_depots_for_setmanifest = {depot_id for depot_id, _ in depot_info}
 
         if os.path.isdir(processing_dir):
-            all_manifest_files_in_dir: List[str] = []
-            for root, _unused_dirs, files in os.walk(processing_dir):
-                for f_name in files:
-                    if f_name.lower().endswith(".manifest"):
-                        all_manifest_files_in_dir.append(os.path.join(root, f_name))
-
-            def sort_key_manifest(filepath: str) -> Tuple[int, str]:
-                filename = os.path.basename(filepath)
-                name_no_suffix = filename.rsplit(".manifest", 1)[0]
-                parts = name_no_suffix.split("_", 1)
-                depot_id_str, manifest_gid_val = parts[0], (
-                    parts[1] if len(parts) > 1 else ""
+            manifest_gids_by_depot: Dict[str, List[str]] = defaultdict(list)
+            for entry in iter_files(processing_dir):
+                manifest_filename = entry.name
+                if not manifest_filename.lower().endswith(".manifest"):
+                    continue
+                name_no_suffix = manifest_filename[: -len(".manifest")]
+                depot_id_from_file, _sep, manifest_gid_val = name_no_suffix.partition(
+                    "_"
                 )
-                try:
-                    depot_id_int = int(depot_id_str) if depot_id_str.isdigit() else 0
-                except ValueError:
-                    depot_id_int = 0
+                if not depot_id_from_file.isdecimal():
                     self.print_colored_ui(
                         tr(
-                            "Warning: Non-numeric depot ID prefix '{depot_id_str}' in manifest filename '{filename}'. Using 0 for sorting."
-                        ).format(depot_id_str=depot_id_str, filename=filename),
+                            "Could not parse numeric DepotID from manifest filename: {manifest_filename}. Entry skipped."
+                        ).format(manifest_filename=manifest_filename),
                         "yellow",
                     )
-                return (depot_id_int, manifest_gid_val)
-
-            try:
-                all_manifest_files_in_dir.sort(key=sort_key_manifest)
-            except Exception as e_sort:
-                self.print_colored_ui(
-                    tr(
-                        "Warning: Could not fully sort manifest files for LUA generation due to naming or error: {error}. LUA script might be sub-optimal."
-                    ).format(error=self.stack_Error(e_sort)),
-                    "yellow",
-                )
-
-            for manifest_full_path in all_manifest_files_in_dir:
-                manifest_filename = os.path.basename(manifest_full_path)
-                name_no_suffix = manifest_filename.rsplit(".manifest", 1)[0]
-                parts = name_no_suffix.split("_", 1)
-                depot_id_from_file, manifest_gid_val = parts[0], (
-                    parts[1] if len(parts) > 1 else ""
-                )
-
-                if depot_id_from_file.isdigit():
-                    if depot_id_from_file not in processed_depots_for_setmanifest:
-                        lua_lines.append(f"addappid({depot_id_from_file})")
-                        processed_depots_for_setmanifest.add(depot_id_from_file)
-                    if manifest_gid_val:
-                        lua_lines.append(
-                            f'setManifestid({depot_id_from_file},"{manifest_gid_val}",0)'
-                        )
-                    else:
-                        self.print_colored_ui(
-                            tr(
-                                "Could not parse Manifest GID from filename: {manifest_filename}. setManifestid entry will be skipped."
-                            ).format(manifest_filename=manifest_filename),
-                            "yellow",
-                        )
+                    continue
+                depot_manifest_gids = manifest_gids_by_depot[depot_id_from_file]
+                if manifest_gid_val:
+                    depot_manifest_gids.append(manifest_gid_val)
                 else:
                     self.print_colored_ui(
                         tr(
-                            "Could not parse numeric DepotID from manifest filename: {manifest_filename}. Entry skipped."
+                            "Could not parse Manifest GID from filename: {manifest_filename}. setManifestid entry will be skipped."
                         ).format(manifest_filename=manifest_filename),
                         "yellow",
                     )
+
+            for depot_id_from_file in sorted(manifest_gids_by_depot, key=int):
+                if depot_id_from_file not in processed_depots_for_setmanifest:
+                    lua_lines.append(f"addappid({depot_id_from_file})")
+                lua_lines.extend(
+                    f'setManifestid({depot_id_from_file},"{manifest_gid_val}",0)'
+                    for manifest_gid_val in sorted(
+                        manifest_gids_by_depot[depot_id_from_file]
+                    )
+                )
         return "\n".join(lua_lines)
 
-    def zip_outcome(
+    async def zip_outcome(
+        self, processing_dir: str, selected_repos_for_zip: List[str]
+    ) -> Optional[str]:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None,
+            partial(self._zip_outcome_sync, processing_dir, selected_repos_for_zip),
+        )
+
+    def _zip_outcome_sync(
         self, processing_dir: str, selected_repos_for_zip: List[str]
     ) -> Optional[str]:
         if not os.path.isdir(processing_dir):
@@ -2615,8 +3647,7 @@ class ManifestDownloader(ctk.CTk):
             self.repos.get(repo_name, "") == "Encrypted"
             for repo_name in selected_repos_for_zip
         )
-        strict_mode_active = self.strict_validation_var.get()
-        key_files_to_exclude_in_strict = ["key.vdf", "config.vdf"]
+        strict_mode_active = self._strict_mode_active
         base_name_from_dir = os.path.basename(os.path.normpath(processing_dir))
         final_zip_base_name = (
             base_name_from_dir[1:-5]
@@ -2649,30 +3680,30 @@ class ManifestDownloader(ctk.CTk):
                 )
                 return None
         try:
-            with zipfile.ZipFile(
-                final_zip_path, "w", zipfile.ZIP_DEFLATED, compresslevel=6
-            ) as zipf:
-                for root, _unused_dirs, files in os.walk(processing_dir):
-                    for file in files:
-                        file_path_abs, file_basename_lower = (
-                            os.path.join(root, file),
-                            file.lower(),
+            # Manifests are already compressed binaries, deflating them only burns CPU.
+            with zipfile.ZipFile(final_zip_path, "w", zipfile.ZIP_STORED) as zipf:
+                for entry in iter_files(processing_dir):
+                    file = entry.name
+                    if strict_mode_active and file.lower() in KEY_FILE_NAMES:
+                        self.print_colored_ui(
+                            tr(
+                                "Excluding '{file}' from final zip (Strict Validation is ON)."
+                            ).format(file=file),
+                            "yellow",
                         )
-                        if (
-                            strict_mode_active
-                            and file_basename_lower in key_files_to_exclude_in_strict
-                        ):
-                            self.print_colored_ui(
-                                tr(
-                                    "Excluding '{file}' from final zip (Strict Validation is ON)."
-                                ).format(file=file),
-                                "yellow",
-                            )
-                            continue
-                        archive_name = os.path.relpath(
-                            file_path_abs, start=processing_dir
+                        continue
+                    archive_name = os.path.relpath(entry.path, start=processing_dir)
+                    # Manifests are already compressed, so only small text files
+                    # get a cheap deflate pass.
+                    if file.lower().endswith(self.DEFLATED_ZIP_EXTENSIONS):
+                        zipf.write(
+                            entry.path,
+                            archive_name,
+                            compress_type=zipfile.ZIP_DEFLATED,
+                            compresslevel=1,
                         )
-                        zipf.write(file_path_abs, archive_name)
+                    else:
+                        zipf.write(entry.path, archive_name)
             self.print_colored_ui(
                 tr("\nSuccessfully created outcome zip: {final_zip_path}").format(
                     final_zip_path=final_zip_path
@@ -2680,9 +3711,8 @@ class ManifestDownloader(ctk.CTk):
                 "cyan",
             )
             try:
-                import shutil
-
-                shutil.rmtree(processing_dir)
+                shutil.rmtree(processing_dir, onerror=retry_locked_removal)
+                self._created_dirs.clear()
                 self.print_colored_ui(
                     tr(
                         "Temporary source folder {processing_dir} deleted successfully."
@@ -2720,6 +3750,8 @@ class ManifestDownloader(ctk.CTk):
     def on_closing(self) -> None:
         if messagebox.askokcancel(tr("Quit"), tr("Do you want to quit?")):
             self.cancel_search = True
+            self._run_coroutine(self._shutdown_event_loop())
+            self._flush_repositories()
             self.settings_manager.set("window_geometry", self.geometry())
             self.settings_manager.save_settings()
             self.destroy()
@@ -2870,6 +3902,21 @@ class ManifestDownloader(ctk.CTk):
                 )
 
         if (
+            hasattr(self, "add_repo_window_ref")
+            and self.add_repo_window_ref is not None
+            and self.add_repo_window_ref.winfo_exists()
+            and not self.add_repo_window_ref.winfo_viewable()
+        ):
+            # Hidden dialogs would keep the old language; drop them so the
+            # next open builds them afresh.
+            self.add_repo_window_ref.destroy()
+        if (
+            hasattr(self, "settings_window_ref")
+            and self.settings_window_ref.winfo_exists()
+            and not self.settings_window_ref.winfo_viewable()
+        ):
+            self.settings_window_ref.destroy()
+        elif (
             hasattr(self, "settings_window_ref")
             and self.settings_window_ref.winfo_exists()
         ):
@@ -2903,7 +3950,12 @@ class ManifestDownloader(ctk.CTk):
                             new_settings_tabview.set(new_settings_tabview._name_list[0])
 
     def toggle_all_repos(self, repo_type_to_toggle: str) -> None:
-        if repo_type_to_toggle.lower() not in ["encrypted", "decrypted", "branch"]:
+        check_list = {
+            "encrypted": self.encrypted_scroll,
+            "decrypted": self.decrypted_scroll,
+            "branch": self.branch_scroll,
+        }.get(repo_type_to_toggle.lower())
+        if check_list is None:
             self.print_colored_ui(
                 tr(
                     "Invalid repository type specified for toggle: {repo_type_to_toggle}."
@@ -2911,18 +3963,9 @@ class ManifestDownloader(ctk.CTk):
                 "red",
             )
             return
-        (
-            all_relevant_currently_selected,
-            relevant_repos_count,
-            repos_of_type_to_process,
-        ) = (True, 0, [])
-        for repo_name, stored_repo_type_in_map in self.repos.items():
-            if stored_repo_type_in_map.lower() == repo_type_to_toggle.lower():
-                relevant_repos_count += 1
-                repos_of_type_to_process.append(repo_name)
-                if repo_name in self.repo_vars and not self.repo_vars[repo_name].get():
-                    all_relevant_currently_selected = False
-        if relevant_repos_count == 0:
+        # Each section already holds its repos, bucketed by refresh_repo_checkboxes.
+        repos_of_type_to_process = check_list.items
+        if not repos_of_type_to_process:
             self.print_colored_ui(
                 tr("No {repo_type_to_toggle} repositories found to toggle.").format(
                     repo_type_to_toggle=repo_type_to_toggle
@@ -2930,10 +3973,14 @@ class ManifestDownloader(ctk.CTk):
                 "yellow",
             )
             return
-        new_selection_state: bool = not all_relevant_currently_selected
-        for repo_name in repos_of_type_to_process:
-            if repo_name in self.repo_vars:
-                self.repo_vars[repo_name].set(new_selection_state)
+        new_selection_state: bool = not all(
+            self.selected_repos.get(repo_name, False)
+            for repo_name in repos_of_type_to_process
+        )
+        self.selected_repos.update(
+            dict.fromkeys(repos_of_type_to_process, new_selection_state)
+        )
+        check_list.refresh_visible()
         action_str: str = tr("Selected") if new_selection_state else tr("Deselected")
         self.print_colored_ui(
             tr("{action_str} all {repo_type_to_toggle} repositories.").format(
@@ -2941,7 +3988,7 @@ class ManifestDownloader(ctk.CTk):
             ),
             "blue",
         )
-        self.save_repositories()
+        self.save_selected_repos()
 
     def open_add_repo_window(self) -> None:
         if (
@@ -2949,6 +3996,13 @@ class ManifestDownloader(ctk.CTk):
             and self.add_repo_window_ref is not None
             and self.add_repo_window_ref.winfo_exists()
         ):
+            if not self.add_repo_window_ref.winfo_viewable():
+                # Closing only hides the window; reset it for the next entry.
+                self.repo_name_entry.delete(0, END)
+                self.repo_state_var.set("Branch")
+                self.add_repo_window_ref.deiconify()
+                self.add_repo_window_ref.grab_set()
+                self.repo_name_entry.focus()
             self.add_repo_window_ref.focus_force()
             return
         self.add_repo_window_ref = ctk.CTkToplevel(self)
@@ -2977,20 +4031,20 @@ class ManifestDownloader(ctk.CTk):
             self.add_repo_window_ref, text=tr("Add"), command=self.add_repo, width=100
         ).pack(padx=10, pady=10)
         self.add_repo_window_ref.protocol(
-            "WM_DELETE_WINDOW", lambda: self._destroy_add_repo_window()
+            "WM_DELETE_WINDOW", lambda: self._hide_add_repo_window()
         )
         self.add_repo_window_ref.bind("<Return>", lambda e: self.add_repo())
         self.add_repo_window_ref.bind(
-            "<Escape>", lambda e: self._destroy_add_repo_window()
+            "<Escape>", lambda e: self._hide_add_repo_window()
         )
 
-    def _destroy_add_repo_window(self) -> None:
+    def _hide_add_repo_window(self) -> None:
         if (
             hasattr(self, "add_repo_window_ref")
             and self.add_repo_window_ref is not None
         ):
-            self.add_repo_window_ref.destroy()
-            self.add_repo_window_ref = None
+            self.add_repo_window_ref.grab_release()
+            self.add_repo_window_ref.withdraw()
 
     def add_repo(self) -> None:
         if (
@@ -3046,18 +4100,13 @@ class ManifestDownloader(ctk.CTk):
             ),
             "green",
         )
-        self._destroy_add_repo_window()
+        self._hide_add_repo_window()
 
     def delete_repo(self) -> None:
         repos_to_delete_names: List[str] = [
-            cb.cget("text")
-            for scroll_frame in [
-                self.encrypted_scroll,
-                self.decrypted_scroll,
-                self.branch_scroll,
-            ]
-            for cb in scroll_frame.winfo_children()
-            if isinstance(cb, ctk.CTkCheckBox) and cb.get() == 1
+            repo_name
+            for repo_name in sorted(self.repos)
+            if self.selected_repos.get(repo_name)
         ]
         if not repos_to_delete_names:
             messagebox.showwarning(
@@ -3074,15 +4123,21 @@ class ManifestDownloader(ctk.CTk):
         )
         if not messagebox.askyesno(tr("Confirm Deletion"), confirmation_message):
             return
-        deleted_count = 0
-        for repo_name_to_delete in repos_to_delete_names:
-            if repo_name_to_delete in self.repos:
+        names_to_delete: Set[str] = self.repos.keys() & set(repos_to_delete_names)
+        deleted_count = len(names_to_delete)
+        if deleted_count > len(self.repos) // 2:
+            # Rebuilding is cheaper than many single deletes for large removals.
+            self.repos = {
+                repo_name: repo_state
+                for repo_name, repo_state in self.repos.items()
+                if repo_name not in names_to_delete
+            }
+        else:
+            for repo_name_to_delete in names_to_delete:
                 del self.repos[repo_name_to_delete]
-                if repo_name_to_delete in self.selected_repos:
-                    del self.selected_repos[repo_name_to_delete]
-                if repo_name_to_delete in self.repo_vars:
-                    del self.repo_vars[repo_name_to_delete]
-                deleted_count += 1
+        # The check lists hold a reference to selected_repos; edit it in place.
+        for repo_name_to_delete in names_to_delete:
+            self.selected_repos.pop(repo_name_to_delete, None)
         if deleted_count > 0:
             self.save_repositories()
             self.refresh_repo_checkboxes()
@@ -3102,54 +4157,33 @@ class ManifestDownloader(ctk.CTk):
             )
 
     def refresh_repo_checkboxes(self) -> None:
-        for scroll_frame in [
-            self.encrypted_scroll,
-            self.decrypted_scroll,
-            self.branch_scroll,
-        ]:
-            for widget in scroll_frame.winfo_children():
-                widget.destroy()
-        new_repo_vars_cache = {}
-        sorted_repo_names = sorted(self.repos.keys())
-        for repo_name in sorted_repo_names:
-            repo_type = self.repos[repo_name]
-            initial_selection_state = self.selected_repos.get(
-                repo_name, (repo_type == "Branch")
-            )
-            var = ctk.BooleanVar(value=initial_selection_state)
-            var.trace_add(
-                "write",
-                lambda name, index, mode, rn=repo_name, v=var: self._update_selected_repo_state(
-                    rn, v.get()
-                ),
-            )
-            new_repo_vars_cache[repo_name] = var
-            target_scroll_frame = None
-            if repo_type == "Encrypted":
-                target_scroll_frame = self.encrypted_scroll
-            elif repo_type == "Decrypted":
-                target_scroll_frame = self.decrypted_scroll
-            elif repo_type == "Branch":
-                target_scroll_frame = self.branch_scroll
-            else:
+        check_list_by_type = {
+            "Encrypted": self.encrypted_scroll,
+            "Decrypted": self.decrypted_scroll,
+            "Branch": self.branch_scroll,
+        }
+        repos_by_list: Dict[VirtualCheckList, List[str]] = {
+            check_list: [] for check_list in check_list_by_type.values()
+        }
+        for repo_name, repo_type in sorted(self.repos.items()):
+            self.selected_repos.setdefault(repo_name, repo_type == "Branch")
+            target_list = check_list_by_type.get(repo_type)
+            if target_list is None:
                 self.print_colored_ui(
                     tr(
                         "Warning: Unknown repository type '{repo_type}' for '{repo_name}'. Assigning to Decrypted section for UI."
                     ).format(repo_type=repo_type, repo_name=repo_name),
                     "yellow",
                 )
-                target_scroll_frame = self.decrypted_scroll
-            if target_scroll_frame:
-                ctk.CTkCheckBox(target_scroll_frame, text=repo_name, variable=var).pack(
-                    anchor="w", padx=10, pady=2
-                )
-        self.repo_vars = new_repo_vars_cache
-        self.save_repositories()
+                target_list = self.decrypted_scroll
+            repos_by_list[target_list].append(repo_name)
+        for check_list, repo_names in repos_by_list.items():
+            check_list.set_items(repo_names)
+        self.save_selected_repos()
 
     def _update_selected_repo_state(self, repo_name: str, is_selected: bool) -> None:
         self.selected_repos[repo_name] = is_selected
-        self.settings_manager.set("selected_repos", self.selected_repos)
-        self.settings_manager.save_settings()
+        self.save_selected_repos()
         action = tr("selected") if is_selected else tr("deselected")
         self.append_progress(
             tr("Repository '{repo_name}' {action}.").format(
@@ -3164,7 +4198,15 @@ class ManifestDownloader(ctk.CTk):
             and self.settings_window_ref is not None
             and self.settings_window_ref.winfo_exists()
         ):
-            self.settings_window_ref.destroy()
+            # Closing only hides the window; rebuild the editable tabs so they
+            # show saved values again, but keep the static About tab as is.
+            self._setup_general_settings_tab(self._settings_general_tab)
+            self._setup_repo_settings_tab(self._settings_repo_tab)
+            self._settings_tabview.set(tr("General Settings"))
+            self.settings_window_ref.deiconify()
+            self.settings_window_ref.grab_set()
+            self.settings_window_ref.after(100, self.settings_window_ref.focus_force)
+            return
         self.settings_window_ref = ctk.CTkToplevel(self)
         self.settings_window_ref.title(tr("Settings"))
         self.settings_window_ref.geometry("700x600")
@@ -3190,15 +4232,18 @@ class ManifestDownloader(ctk.CTk):
         self._setup_about_tab(about_tab)
 
         settings_tabview.set(general_tab_title)
+        self._settings_tabview = settings_tabview
+        self._settings_general_tab = general_tab
+        self._settings_repo_tab = repo_settings_tab
         self.settings_window_ref.protocol(
-            "WM_DELETE_WINDOW", lambda: self._destroy_settings_window()
+            "WM_DELETE_WINDOW", lambda: self._hide_settings_window()
         )
         self.settings_window_ref.after(100, self.settings_window_ref.focus_force)
 
-    def _destroy_settings_window(self):
+    def _hide_settings_window(self):
         if hasattr(self, "settings_window_ref") and self.settings_window_ref:
-            self.settings_window_ref.destroy()
-            self.settings_window_ref = None
+            self.settings_window_ref.grab_release()
+            self.settings_window_ref.withdraw()
 
     def _setup_general_settings_tab(self, parent_tab: ctk.CTkFrame) -> None:
         for widget in parent_tab.winfo_children():
@@ -3376,9 +4421,7 @@ class ManifestDownloader(ctk.CTk):
         check_now_button = ctk.CTkButton(
             update_check_frame,
             text=tr("Check for Updates Now"),
-            command=lambda: threading.Thread(
-                target=self.run_update_check, daemon=True
-            ).start(),
+            command=lambda: self._run_coroutine(self.async_check_for_updates()),
         )
         check_now_button.pack(side="right", padx=0, pady=5)
         Tooltip(check_now_button, tr("Manually check for a new version of SDO."))
@@ -3434,9 +4477,7 @@ class ManifestDownloader(ctk.CTk):
                     and self.rate_limit_display_label
                 ):
                     self.after(0, self._update_rate_limit_label, tr("Checking..."))
-                threading.Thread(
-                    target=self.run_check_rate_limit, args=(False,), daemon=True
-                ).start()
+                self._run_coroutine(self._async_check_github_rate_limit(False))
             else:
                 if (
                     hasattr(self, "rate_limit_display_label")
@@ -3453,19 +4494,7 @@ class ManifestDownloader(ctk.CTk):
         if hasattr(self, "rate_limit_display_label") and self.rate_limit_display_label:
             self.after(0, self._update_rate_limit_label, tr("Checking..."))
 
-        threading.Thread(
-            target=self.run_check_rate_limit, args=(True,), daemon=True
-        ).start()
-
-    def run_check_rate_limit(self, use_token_override: bool = True) -> None:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            loop.run_until_complete(
-                self._async_check_github_rate_limit(use_token_override)
-            )
-        finally:
-            loop.close()
+        self._run_coroutine(self._async_check_github_rate_limit(True))
 
     async def _async_check_github_rate_limit(self, use_token_override: bool) -> None:
         final_display_text = tr("N/A")
@@ -3485,14 +4514,14 @@ class ManifestDownloader(ctk.CTk):
 
         url = "https://api.github.com/rate_limit"
         try:
-            async with aiohttp.ClientSession() as session:
+            async with self._create_http_session() as session:
                 async with session.get(
                     url,
                     headers=request_headers,
                     timeout=aiohttp.ClientTimeout(total=10),
                 ) as response:
                     if response.status == 200:
-                        data = await response.json()
+                        data = await response.json(loads=load_json)
                         core_limit_data = data.get("resources", {}).get("core", {})
                         if not core_limit_data and not is_authenticated_check:
                             core_limit_data = data.get("rate", {})
@@ -3632,41 +4661,7 @@ class ManifestDownloader(ctk.CTk):
         info_scrollbar = ctk.CTkScrollbar(info_text_frame, command=info_textbox.yview)
         info_scrollbar.pack(side="right", fill="y")
         info_textbox.configure(yscrollcommand=info_scrollbar.set)
-        tags_config = {
-            "bold": {"font": ("Helvetica", 11, "bold")},
-            "italic": {"font": ("Helvetica", 11, "italic")},
-            "title": {
-                "font": ("Helvetica", 14, "bold"),
-                "foreground": "cyan",
-                "spacing1": 10,
-                "spacing3": 15,
-                "justify": "center",
-            },
-            "subtitle": {
-                "font": ("Helvetica", 12, "bold"),
-                "foreground": "deepskyblue",
-                "spacing1": 8,
-                "spacing3": 8,
-            },
-            "highlight": {"foreground": "lawn green"},
-            "note": {"foreground": "orange"},
-            "normal": {"font": ("Helvetica", 11), "spacing3": 5},
-            "url": {
-                "font": ("Helvetica", 11),
-                "foreground": "light sky blue",
-                "underline": True,
-            },
-            "code": {
-                "font": ("Courier New", 10),
-                "background": "#404040",
-                "foreground": "#E0E0E0",
-                "lmargin1": 15,
-                "lmargin2": 15,
-                "spacing1": 3,
-                "spacing3": 3,
-            },
-        }
-        for tag, conf in tags_config.items():
+        for tag, conf in self.ABOUT_TEXT_TAGS.items():
             info_textbox.tag_configure(tag, **conf)
         info_content = [
             (
@@ -3866,8 +4861,11 @@ class ManifestDownloader(ctk.CTk):
             ),
         ]
         info_textbox.configure(state="normal")
-        for text, tag_name in info_content:
-            info_textbox.insert("end", text, tag_name)
+        # One insert call takes alternating text/tag pairs, saving a Tcl round
+        # trip per segment.
+        info_textbox.insert(
+            "end", *[part for segment in info_content for part in segment]
+        )
         info_textbox.configure(state="disabled")
         info_textbox.see("1.0")
 
@@ -4048,28 +5046,20 @@ class ManifestDownloader(ctk.CTk):
                 parent=self.settings_window_ref,
             )
 
-    def run_update_check(self) -> None:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            loop.run_until_complete(self.async_check_for_updates())
-        finally:
-            loop.close()
-
     async def async_check_for_updates(self) -> None:
         self.append_progress(tr("Checking for SDO updates..."), "default")
         request_headers = (
             self._get_github_headers() if self._get_github_headers() else {}
         )
         try:
-            async with aiohttp.ClientSession() as session:
+            async with self._create_http_session() as session:
                 async with session.get(
                     self.GITHUB_RELEASES_API,
                     headers=request_headers,
                     timeout=aiohttp.ClientTimeout(total=10),
                 ) as response:
                     response.raise_for_status()
-                    data = await response.json()
+                    data = await response.json(loads=load_json)
             latest_version_tag_raw = data.get("tag_name", "v0.0.0")
             latest_version_tag = re.sub(r"[^0-9.]", "", latest_version_tag_raw).strip(
                 "."
@@ -4160,8 +5150,8 @@ class ManifestDownloader(ctk.CTk):
         )
         if filepath:
             try:
-                with open(filepath, "w", encoding="utf-8") as f:
-                    json.dump(self.repos, f, indent=4)
+                with open(filepath, "wb") as f:
+                    f.write(dump_json_bytes(self.repos))
                 self.append_progress(
                     tr("Repositories exported successfully to: {filepath}").format(
                         filepath=filepath